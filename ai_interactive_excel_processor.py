@@ -6,12 +6,40 @@ Uses Gemini AI to ask intelligent questions and process Excel files
 
 import pandas as pd
 import numpy as np
+import re
 from datetime import datetime, timedelta
-import json
+import orjson
 import requests
+import xlsxwriter
 from config import GEMINI_API_KEY, GEMINI_API_URL
 import tempfile
 import os
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+# Only the most recent turns are sent back to the model
+MAX_HISTORY = 10
+
+# Sample rows shown to the model, limited to the leading columns of wide sheets
+SAMPLE_ROWS = 3
+SAMPLE_COLUMNS = 20
+
+# Sample rows may carry non-string column names, numpy scalars and timestamps
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+# Column-name patterns deciding which columns each modification works on
+COLUMN_PATTERNS = {
+    'date': re.compile('date'),
+    'amount': re.compile('amount'),
+    'value': re.compile('amount|price|cost'),
+    'category': re.compile('category|type|status'),
+}
+
+# A processor is created per request, so the pooled session lives at module level
+# and follow-up questions reuse the open TLS connection
+_http = requests.Session()
+_http.headers.update({'Content-Type': 'application/json'})
+atexit.register(_http.close)
 
 class AIInteractiveExcelProcessor:
     def __init__(self):
@@ -20,26 +48,40 @@ class AIInteractiveExcelProcessor:
         self.user_requirements = {}
         self.original_data = {}
         self.conversation_history = []
+        self._summary_json = None
+        
+        # Requirement keywords in match priority, mapped to the step they trigger
+        self._filter_handlers = {
+            'date': self._date_filter_mask,
+            'amount': self._amount_filter_mask,
+            'category': self._category_filter_mask,
+        }
+        self._calculation_keywords = ('total', 'percentage', 'average', 'growth')
+        self._modification_handlers = {
+            'sort': self._apply_sorting,
+            'duplicate': lambda df, columns: df.drop_duplicates(),
+            'consolidate': lambda df, columns: self._consolidate_data(df),
+        }
         
     def analyze_excel_with_ai(self, filepath: str) -> dict:
         """
         Use AI to analyze Excel and start intelligent conversation
         """
         try:
-            # Load the Excel file
-            excel_file = pd.ExcelFile(filepath)
+            # Load every sheet in one pass so the workbook is only parsed once
+            all_sheets = self._read_all_sheets(filepath)
             sheets_data = {}
-            
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(filepath, sheet_name=sheet_name)
+
+            for sheet_name, df in all_sheets.items():
                 sheets_data[sheet_name] = {
                     'data': df,
                     'columns': list(df.columns),
                     'rows': len(df),
-                    'sample_data': df.head(3).to_dict('records')
+                    'sample_data': self._sample_rows(df)
                 }
             
             self.original_data = sheets_data
+            self._summary_json = None
             
             # Use AI to analyze and generate first question
             first_question = self._generate_ai_question(sheets_data, "initial_analysis")
@@ -62,24 +104,26 @@ class AIInteractiveExcelProcessor:
                 'message': f'Error analyzing Excel: {str(e)}'
             }
     
+    def _read_all_sheets(self, filepath: str) -> dict:
+        """Read every sheet with the native calamine parser, falling back to openpyxl"""
+        try:
+            return pd.read_excel(filepath, sheet_name=None, engine='calamine')
+        except Exception as e:
+            # openpyxl only reads xlsx/xlsm, so for other formats calamine is the only engine
+            if filepath.lower().endswith(('.xlsb', '.xls', '.ods')):
+                raise
+            # calamine is stricter about malformed workbooks than openpyxl
+            print(f"calamine could not read the file ({e}), retrying with openpyxl")
+            return pd.read_excel(filepath, sheet_name=None, engine='openpyxl')
+    
     def _generate_ai_question(self, sheets_data: dict, context: str) -> str:
         """
         Use Gemini AI to generate intelligent questions
         """
         try:
-            # Prepare data summary for AI
-            data_summary = self._create_data_summary(sheets_data)
-            
-            prompt = f"""
-            You are an AI Excel processing assistant. Analyze this Excel file data and ask ONE intelligent question to understand what the user wants to do with their data.
-
-            EXCEL FILE DATA:
-            {json.dumps(data_summary, indent=2)}
-
-            CONTEXT: {context}
-
-            CONVERSATION HISTORY:
-            {json.dumps(self.conversation_history, indent=2)}
+            # Static prefix first, per-turn context last, so repeated turns share a cacheable prefix
+            prompt = self._context_prefix(sheets_data) + f"""
+            Ask ONE intelligent question to understand what the user wants to do with their data.
 
             Based on the data structure and content, ask ONE specific, intelligent question that will help you understand exactly what the user wants to do. Be specific about:
             1. Which columns/sheets they want to modify
@@ -95,6 +139,11 @@ class AIInteractiveExcelProcessor:
             Ask ONE specific question that shows you understand their data and offers concrete options.
             - "I notice you have multiple sheets. Would you prefer a consolidated view or separate analysis for each sheet?"
 
+            CONTEXT: {context}
+
+            CONVERSATION HISTORY:
+            {self._serialize_history()}
+
             Return ONLY the question, nothing else.
             """
             
@@ -163,16 +212,13 @@ class AIInteractiveExcelProcessor:
         Use AI to analyze user intent and extract requirements
         """
         try:
-            prompt = f"""
+            prompt = self._context_prefix(self.original_data) + f"""
             Analyze this user response and determine what they want to do with their Excel data.
 
             USER RESPONSE: "{user_response}"
 
             CONVERSATION HISTORY:
-            {json.dumps(self.conversation_history, indent=2)}
-
-            EXCEL DATA SUMMARY:
-            {json.dumps(self._create_data_summary(self.original_data), indent=2)}
+            {self._serialize_history()}
 
             Determine:
             1. ACTION: "ask_follow_up" (need more info) or "process_requirements" (ready to process)
@@ -198,9 +244,9 @@ class AIInteractiveExcelProcessor:
             
             # Try to parse JSON response
             try:
-                analysis = json.loads(response)
+                analysis = orjson.loads(response)
                 return analysis
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # Fallback: ask for more information
                 return {
                     'action': 'ask_follow_up',
@@ -221,12 +267,15 @@ class AIInteractiveExcelProcessor:
         Process Excel file based on AI-extracted requirements
         """
         try:
-            # Process each sheet based on requirements
-            modified_sheets = {}
-            
-            for sheet_name, sheet_info in self.original_data.items():
-                modified_df = self._apply_ai_modifications(sheet_name, sheet_info['data'], requirements)
-                modified_sheets[sheet_name] = modified_df
+            # Sheets are independent and the heavy lifting happens in numpy/pandas,
+            # which releases the GIL, so process them side by side
+            workers = min(len(self.original_data), os.cpu_count() or 1) or 1
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    sheet_name: executor.submit(self._apply_ai_modifications, sheet_name, sheet_info['data'], requirements)
+                    for sheet_name, sheet_info in self.original_data.items()
+                }
+                modified_sheets = {sheet_name: future.result() for sheet_name, future in futures.items()}
             
             # Generate output file
             output_filepath = self._create_output_file(modified_sheets, requirements)
@@ -253,104 +302,156 @@ class AIInteractiveExcelProcessor:
         """
         Apply modifications based on AI-understood requirements
         """
-        modified_df = df.copy()
-        
         modifications = requirements.get('modifications', [])
         calculations = requirements.get('calculations', [])
         filters = requirements.get('filters', [])
         
-        # Apply filters
-        for filter_type in filters:
-            if 'date' in filter_type.lower():
-                modified_df = self._apply_date_filter(modified_df)
-            elif 'amount' in filter_type.lower():
-                modified_df = self._apply_amount_filter(modified_df)
-            elif 'category' in filter_type.lower():
-                modified_df = self._apply_category_filter(modified_df)
-        
-        # Apply calculations
-        for calc_type in calculations:
-            if 'total' in calc_type.lower():
-                modified_df = self._add_totals(modified_df)
-            elif 'percentage' in calc_type.lower():
-                modified_df = self._add_percentages(modified_df)
-            elif 'average' in calc_type.lower():
-                modified_df = self._add_averages(modified_df)
-            elif 'growth' in calc_type.lower():
-                modified_df = self._add_growth_rates(modified_df)
+        columns = self._categorize_columns(df)
+        
+        # Combine filters into a single row mask and apply it once
+        mask = np.ones(len(df), dtype=bool)
+        requested_filters = {self._match_keyword(filter_type, self._filter_handlers) for filter_type in filters}
+        for keyword in self._filter_handlers.keys() & requested_filters:
+            mask &= self._filter_handlers[keyword](df, columns)
+        
+        # Boolean indexing already yields new data, so nothing is copied up front
+        modified_df = df if mask.all() else df.loc[mask]
+        
+        # Collect requested calculations so shared numeric work runs once
+        requested = {self._match_keyword(calc_type, self._calculation_keywords) for calc_type in calculations}
+        
+        # Only new columns are written, so a shallow copy keeps the source sheet untouched
+        if requested & {'total', 'average', 'percentage'}:
+            modified_df = modified_df.copy(deep=False)
+            
+            # Extract the numeric columns once and share the block between the helpers
+            numeric_cols = modified_df.select_dtypes(include=[np.number]).columns
+            values = modified_df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        if 'total' in requested or 'average' in requested:
+            modified_df = self._add_row_statistics(
+                modified_df, totals='total' in requested, averages='average' in requested,
+                numeric_cols=numeric_cols, values=values
+            )
+        if 'percentage' in requested:
+            modified_df = self._add_percentages(modified_df, columns, numeric_cols=numeric_cols, values=values)
+        if 'growth' in requested:
+            modified_df = self._add_growth_rates(modified_df, columns)
         
         # Apply modifications
         for mod_type in modifications:
-            if 'sort' in mod_type.lower():
-                modified_df = self._apply_sorting(modified_df)
-            elif 'duplicate' in mod_type.lower():
-                modified_df = modified_df.drop_duplicates()
-            elif 'consolidate' in mod_type.lower():
-                modified_df = self._consolidate_data(modified_df)
+            keyword = self._match_keyword(mod_type, self._modification_handlers)
+            if keyword is None:
+                continue
+            modified_df = self._modification_handlers[keyword](modified_df, columns)
+            if keyword == 'consolidate':
+                # Consolidation drops the non-key, non-numeric columns
+                columns = self._categorize_columns(modified_df)
         
         return modified_df
     
-    def _apply_date_filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply date filtering"""
-        date_cols = [col for col in df.columns if 'date' in col.lower()]
+    def _match_keyword(self, requirement: str, keywords) -> str:
+        """First keyword contained in the requirement text, or None"""
+        requirement = requirement.lower()
+        for keyword in keywords:
+            if keyword in requirement:
+                return keyword
+        return None
+    
+    def _sample_rows(self, df: pd.DataFrame) -> list:
+        """First few rows of the leading columns as records for the prompt"""
+        sample = df.iloc[:SAMPLE_ROWS, :SAMPLE_COLUMNS]
+        return [dict(zip(sample.columns, row)) for row in sample.itertuples(index=False, name=None)]
+    
+    def _categorize_columns(self, df: pd.DataFrame) -> dict:
+        """Group column names by role, lowercasing each name only once"""
+        lowered = [str(col).lower() for col in df.columns]
+        return {
+            kind: [col for col, name in zip(df.columns, lowered) if pattern.search(name)]
+            for kind, pattern in COLUMN_PATTERNS.items()
+        }
+    
+    def _date_filter_mask(self, df: pd.DataFrame, columns: dict) -> np.ndarray:
+        """Mask for rows within the last 30 days"""
+        date_cols = columns['date']
         if date_cols and pd.api.types.is_datetime64_any_dtype(df[date_cols[0]]):
             cutoff_date = datetime.now() - timedelta(days=30)
-            return df[df[date_cols[0]] >= cutoff_date]
-        return df
+            return (df[date_cols[0]] >= cutoff_date).to_numpy(dtype=bool, na_value=False)
+        return np.ones(len(df), dtype=bool)
     
-    def _apply_amount_filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply amount filtering"""
-        amount_cols = [col for col in df.columns if any(word in col.lower() for word in ['amount', 'price', 'cost'])]
+    def _amount_filter_mask(self, df: pd.DataFrame, columns: dict) -> np.ndarray:
+        """Mask for rows with a positive amount"""
+        amount_cols = columns['value']
         if amount_cols:
-            return df[df[amount_cols[0]] > 0]
-        return df
+            return (df[amount_cols[0]] > 0).to_numpy(dtype=bool, na_value=False)
+        return np.ones(len(df), dtype=bool)
     
-    def _apply_category_filter(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Apply category filtering"""
-        category_cols = [col for col in df.columns if any(word in col.lower() for word in ['category', 'type', 'status'])]
+    def _category_filter_mask(self, df: pd.DataFrame, columns: dict) -> np.ndarray:
+        """Mask for rows with a category value"""
+        category_cols = columns['category']
         if category_cols:
-            return df[df[category_cols[0]].notna()]
-        return df
+            return df[category_cols[0]].notna().to_numpy()
+        return np.ones(len(df), dtype=bool)
     
-    def _add_totals(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add total calculations"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        if len(numeric_cols) > 1:
-            df['Row_Total'] = df[numeric_cols].sum(axis=1)
+    def _add_row_statistics(self, df: pd.DataFrame, totals: bool, averages: bool,
+                            numeric_cols=None, values=None) -> pd.DataFrame:
+        """Add row totals and averages from a single pass over the numeric columns"""
+        if numeric_cols is None:
+            numeric_cols = df.select_dtypes(include=[np.number]).columns
+        if len(numeric_cols) == 0:
+            return df
+        
+        if values is None:
+            values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        row_sum = np.where(present, values, 0.0).sum(axis=1)
+        
+        if totals and len(numeric_cols) > 1:
+            df['Row_Total'] = row_sum
+        if averages:
+            counts = present.sum(axis=1)
+            row_mean = np.full(len(df), np.nan)
+            np.divide(row_sum, counts, out=row_mean, where=counts > 0)
+            df['Average_Value'] = row_mean
         return df
     
-    def _add_percentages(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_percentages(self, df: pd.DataFrame, columns: dict, numeric_cols=None, values=None) -> pd.DataFrame:
         """Add percentage calculations"""
-        amount_cols = [col for col in df.columns if 'amount' in col.lower()]
+        amount_cols = columns['amount']
         if amount_cols:
-            total_amount = df[amount_cols[0]].sum()
-            df['Amount_Percentage'] = (df[amount_cols[0]] / total_amount * 100).round(2)
-        return df
-    
-    def _add_averages(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Add average calculations"""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        if len(numeric_cols) > 0:
-            df['Average_Value'] = df[numeric_cols].mean(axis=1)
+            if numeric_cols is not None and amount_cols[0] in numeric_cols:
+                # Reuse the pre-extracted column instead of going back through the frame
+                amounts = values[:, numeric_cols.get_loc(amount_cols[0])]
+                df['Amount_Percentage'] = np.round(amounts / np.nansum(amounts) * 100, 2)
+            else:
+                total_amount = df[amount_cols[0]].sum()
+                df['Amount_Percentage'] = (df[amount_cols[0]] / total_amount * 100).round(2)
         return df
     
-    def _add_growth_rates(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_growth_rates(self, df: pd.DataFrame, columns: dict) -> pd.DataFrame:
         """Add growth rate calculations"""
-        date_cols = [col for col in df.columns if 'date' in col.lower()]
-        amount_cols = [col for col in df.columns if 'amount' in col.lower()]
+        date_cols = columns['date']
+        amount_cols = columns['amount']
         
         if date_cols and amount_cols:
             df = df.sort_values(date_cols[0])
-            df['Growth_Rate'] = df[amount_cols[0]].pct_change() * 100
+            amounts = df[amount_cols[0]].to_numpy(dtype=np.float64, na_value=np.nan)
+            growth = np.empty_like(amounts)
+            if len(amounts):
+                growth[0] = np.nan
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    np.divide(np.diff(amounts), amounts[:-1], out=growth[1:])
+                growth[1:] *= 100
+            df['Growth_Rate'] = growth
         return df
     
-    def _apply_sorting(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _apply_sorting(self, df: pd.DataFrame, columns: dict) -> pd.DataFrame:
         """Apply intelligent sorting"""
-        date_cols = [col for col in df.columns if 'date' in col.lower()]
+        date_cols = columns['date']
         if date_cols:
             return df.sort_values(date_cols[0], ascending=False)
         
-        amount_cols = [col for col in df.columns if 'amount' in col.lower()]
+        amount_cols = columns['amount']
         if amount_cols:
             return df.sort_values(amount_cols[0], ascending=False)
         
@@ -364,23 +465,71 @@ class AIInteractiveExcelProcessor:
             if df[col].dtype == 'object' and df[col].nunique() < len(df) * 0.5:
                 group_cols.append(col)
         
-        if group_cols:
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
-            return df.groupby(group_cols)[numeric_cols].sum().reset_index()
+        if not group_cols:
+            return df
         
-        return df
+        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        
+        # Factorize each key column once; rows with a missing key are dropped like groupby does
+        factorized = [pd.factorize(df[col], sort=True) for col in group_cols]
+        key_codes = np.column_stack([codes for codes, _ in factorized])
+        valid = (key_codes >= 0).all(axis=1)
+        groups, inverse = np.unique(key_codes[valid], axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        
+        # Sum every numeric column in a single scatter-add over a 2D block
+        values = df.loc[valid, numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        sums = np.zeros((len(groups), len(numeric_cols)))
+        np.add.at(sums, inverse, np.where(np.isnan(values), 0.0, values))
+        
+        consolidated = {
+            col: np.asarray(uniques)[groups[:, i]]
+            for i, (col, (_, uniques)) in enumerate(zip(group_cols, factorized))
+        }
+        for i, col in enumerate(numeric_cols):
+            consolidated[col] = pd.Series(sums[:, i]).astype(df[col].dtype)
+        
+        return pd.DataFrame(consolidated)
     
     def _create_output_file(self, modified_sheets: dict, requirements: dict) -> str:
         """Create output Excel file"""
         temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
         temp_file.close()
         
-        with pd.ExcelWriter(temp_file.name, engine='openpyxl') as writer:
+        # constant_memory flushes each row once written, so cells must arrive row by row;
+        # pandas' to_excel emits them column by column, hence the direct writer
+        workbook = xlsxwriter.Workbook(temp_file.name, {'constant_memory': True})
+        try:
+            header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+            datetime_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
             for sheet_name, df in modified_sheets.items():
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+                self._write_sheet(workbook, sheet_name, df, header_format, datetime_format)
+        finally:
+            workbook.close()
         
         return temp_file.name
     
+    def _write_sheet(self, workbook, sheet_name: str, df: pd.DataFrame, header_format, datetime_format):
+        """Write one sheet in row order, leaving missing values blank and infinities as text"""
+        worksheet = workbook.add_worksheet(sheet_name)
+        
+        columns = []
+        for col_idx, col in enumerate(df.columns):
+            series = df.iloc[:, col_idx]
+            if pd.api.types.is_datetime64_any_dtype(series):
+                worksheet.set_column(col_idx, col_idx, 20, datetime_format)
+            values = series.astype(object).where(series.notna(), None).to_numpy()
+            if pd.api.types.is_float_dtype(series):
+                # write_number() rejects inf (e.g. growth from a zero amount); write it as text like pandas' inf_rep
+                numbers = series.to_numpy(dtype=np.float64, na_value=np.nan)
+                values[np.isposinf(numbers)] = 'inf'
+                values[np.isneginf(numbers)] = '-inf'
+            columns.append(values.tolist())
+        
+        worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+        for row_idx, row in enumerate(zip(*columns), start=1):
+            worksheet.write_row(row_idx, 0, row)
+    
     def _get_modifications_summary(self, requirements: dict) -> list:
         """Get summary of modifications applied"""
         modifications = []
@@ -414,6 +563,30 @@ class AIInteractiveExcelProcessor:
         
         return summary
     
+    def _context_prefix(self, sheets_data: dict) -> str:
+        """Prompt prefix that stays byte-identical across turns for provider prompt caching"""
+        return f"""
+            You are an AI Excel processing assistant working with the Excel file summarised below.
+
+            EXCEL FILE DATA:
+            {self._serialize_data_summary(sheets_data)}
+            """
+    
+    def _serialize_data_summary(self, sheets_data: dict) -> str:
+        """Compact JSON data summary, built once per loaded file"""
+        if sheets_data is not self.original_data:
+            return orjson.dumps(self._create_data_summary(sheets_data), default=str, option=JSON_OPTIONS).decode()
+        
+        if self._summary_json is None:
+            self._summary_json = orjson.dumps(
+                self._create_data_summary(self.original_data), default=str, option=JSON_OPTIONS
+            ).decode()
+        return self._summary_json
+    
+    def _serialize_history(self) -> str:
+        """Compact JSON of the most recent conversation turns"""
+        return orjson.dumps(self.conversation_history[-MAX_HISTORY:]).decode()
+    
     def _create_conversation_summary(self) -> str:
         """Create summary of the conversation"""
         summary = "Conversation Summary:\n"
@@ -427,10 +600,6 @@ class AIInteractiveExcelProcessor:
     def _call_gemini_api(self, prompt: str) -> str:
         """Call Gemini API"""
         try:
-            headers = {
-                'Content-Type': 'application/json',
-            }
-            
             data = {
                 'contents': [{
                     'parts': [{'text': prompt}]
@@ -441,15 +610,14 @@ class AIInteractiveExcelProcessor:
                 }
             }
             
-            response = requests.post(
+            response = _http.post(
                 f"{self.api_url}?key={self.api_key}",
-                headers=headers,
                 json=data,
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 if 'candidates' in result and len(result['candidates']) > 0:
                     return result['candidates'][0]['content']['parts'][0]['text']
             
@@ -1,97 +1,187 @@
 import pandas as pd
 import numpy as np
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+import logging
 import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, Any, Tuple, List
 import json
 
+logger = logging.getLogger(__name__)
+
+# Processed workbooks kept in memory, keyed by path, mtime and size
+CACHE_SIZE = 16
+
+# Sheet-name keywords for each data type, checked in this order
+SHEET_PATTERNS = {
+    'transactions': re.compile(r'transaction|sales|revenue|expense|ledger'),
+    'campaigns': re.compile(r'campaign|marketing|ad|spend'),
+    'targets': re.compile(r'target|goal|budget|forecast|metric')
+}
+
 class BulletproofExcelProcessor:
     """
     Bulletproof Excel processor that ensures 100% accurate data processing
     """
     
-    def __init__(self):
+    def __init__(self, fill_missing: str = 'constant'):
+        # 'constant' fills missing columns with zeros/'Unknown'; 'synthetic' draws random sample values
+        self.fill_missing = fill_missing
         self.required_sheets = ['Transactions', 'Campaign_Data', 'Targets']
+        # Column aliases are matched case-insensitively
         self.column_mappings = {
             'Transactions': {
-                'date': ['Date', 'date', 'DATE', 'transaction_date', 'Transaction_Date'],
-                'description': ['Description', 'description', 'DESCRIPTION', 'desc', 'Desc'],
-                'category': ['Category', 'category', 'CATEGORY', 'type', 'Type'],
-                'amount': ['Amount', 'amount', 'AMOUNT', 'value', 'Value', 'price', 'Price']
+                'Date': ['date', 'transaction_date'],
+                'Description': ['description', 'desc'],
+                'Category': ['category', 'type'],
+                'Amount': ['amount', 'value', 'price']
             },
             'Campaign_Data': {
-                'timestamp': ['Timestamp', 'timestamp', 'TIMESTAMP', 'date', 'Date'],
-                'campaign_id': ['Campaign_ID', 'campaign_id', 'CampaignID', 'campaign', 'Campaign'],
-                'channel': ['Channel', 'channel', 'CHANNEL', 'source', 'Source'],
-                'spend': ['Spend', 'spend', 'SPEND', 'cost', 'Cost', 'budget', 'Budget'],
-                'acquisitions': ['Acquisitions', 'acquisitions', 'ACQUISITIONS', 'conversions', 'Conversions']
+                'Timestamp': ['timestamp', 'date'],
+                'Campaign_ID': ['campaign_id', 'campaignid', 'campaign'],
+                'Channel': ['channel', 'source'],
+                'Spend': ['spend', 'cost', 'budget'],
+                'Acquisitions': ['acquisitions', 'conversions']
             },
             'Targets': {
-                'metric_name': ['Metric_Name', 'metric_name', 'Metric', 'metric', 'KPI', 'kpi'],
-                'value': ['Value', 'value', 'VALUE', 'target', 'Target', 'goal', 'Goal']
+                'Metric_Name': ['metric_name', 'metric', 'kpi'],
+                'Value': ['value', 'target', 'goal']
             }
         }
+        # Casefolded alias -> output column name per sheet type
+        self._reverse_maps = {
+            sheet: {alias.casefold(): standard_col for standard_col, aliases in cols.items() for alias in aliases}
+            for sheet, cols in self.column_mappings.items()
+        }
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def process_excel_file(self, filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict[str, Any]]:
         """
         Process Excel file with bulletproof accuracy
         """
         try:
-            print(f"🔍 Processing Excel file: {os.path.basename(filepath)}")
+            cache_key = self._cache_key(filepath)
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.debug("Using cached result for %s", os.path.basename(filepath))
+                return self._copy_result(cached)
             
-            # Read all sheets
-            all_sheets = pd.read_excel(filepath, sheet_name=None)
-            print(f"📊 Found {len(all_sheets)} sheets: {list(all_sheets.keys())}")
+            logger.debug("Processing Excel file: %s", os.path.basename(filepath))
             
-            # Identify sheets
-            sheet_mapping = self._identify_sheets(all_sheets)
-            print(f"🎯 Sheet mapping: {sheet_mapping}")
+            # Identify sheets by name and parse only the ones that are used
+            sheet_names, sheet_mapping, all_sheets = self._read_sheets(filepath)
+            logger.debug("Found %d sheets: %s", len(sheet_names), sheet_names)
+            logger.debug("Sheet mapping: %s", sheet_mapping)
             
-            # Process each sheet
-            transactions_df = self._process_transactions_sheet(all_sheets, sheet_mapping)
-            campaigns_df = self._process_campaigns_sheet(all_sheets, sheet_mapping)
-            targets_df = self._process_targets_sheet(all_sheets, sheet_mapping)
+            # Process each sheet; the processors are independent and pandas releases the GIL
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(process, all_sheets, sheet_mapping)
+                    for process in (self._process_transactions_sheet, self._process_campaigns_sheet, self._process_targets_sheet)
+                ]
+                transactions_df, campaigns_df, targets_df = [future.result() for future in futures]
             
             # Create file info
             file_info = {
                 'filename': os.path.basename(filepath),
-                'sheets_found': list(all_sheets.keys()),
+                'sheets_found': sheet_names,
                 'processing_method': 'bulletproof_processor',
                 'data_quality': 'excellent'
             }
             
-            print(f"✅ Successfully processed:")
-            print(f"   - Transactions: {len(transactions_df)} rows")
-            print(f"   - Campaigns: {len(campaigns_df)} rows") 
-            print(f"   - Targets: {len(targets_df)} rows")
+            logger.debug(
+                "Processed %d transactions, %d campaigns, %d targets",
+                len(transactions_df), len(campaigns_df), len(targets_df)
+            )
             
-            return transactions_df, campaigns_df, targets_df, file_info
+            result = (transactions_df, campaigns_df, targets_df, file_info)
+            with self._cache_lock:
+                self._cache[cache_key] = result
+                if len(self._cache) > CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            return self._copy_result(result)
             
         except Exception as e:
-            print(f"❌ Error processing Excel file: {e}")
+            logger.error("Error processing Excel file: %s", e)
             # Return default data as fallback
             return self._create_default_data(filepath)
     
-    def _identify_sheets(self, all_sheets: Dict[str, pd.DataFrame]) -> Dict[str, str]:
+    def _cache_key(self, filepath: str) -> Tuple[str, int, int]:
+        """Identify a file's current contents without reading it"""
+        stat = os.stat(filepath)
+        return os.path.realpath(filepath), stat.st_mtime_ns, stat.st_size
+    
+    def _copy_result(self, result: Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict[str, Any]]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict[str, Any]]:
+        """Shallow copies so callers adding columns don't touch the cached frames"""
+        transactions_df, campaigns_df, targets_df, file_info = result
+        return (
+            transactions_df.copy(deep=False),
+            campaigns_df.copy(deep=False),
+            targets_df.copy(deep=False),
+            dict(file_info)
+        )
+    
+    def _read_sheets(self, filepath: str) -> Tuple[List[str], Dict[str, str], Dict[str, pd.DataFrame]]:
+        """Read the identified sheets with the native calamine parser, falling back to openpyxl"""
+        try:
+            return self._parse_identified_sheets(filepath, 'calamine')
+        except Exception as e:
+            # openpyxl only reads xlsx/xlsm, so for other formats calamine is the only engine
+            if filepath.lower().endswith(('.xlsb', '.xls', '.ods')):
+                raise
+            # calamine is stricter about malformed workbooks than openpyxl
+            logger.warning("calamine could not read the file (%s), retrying with openpyxl", e)
+            return self._parse_identified_sheets(filepath, 'openpyxl')
+    
+    def _parse_identified_sheets(self, filepath: str, engine: str) -> Tuple[List[str], Dict[str, str], Dict[str, pd.DataFrame]]:
+        """Open the workbook once and parse only the sheets the mapping points at, each a single time"""
+        with pd.ExcelFile(filepath, engine=engine) as workbook:
+            sheet_names = workbook.sheet_names
+            sheet_mapping = self._identify_sheets(sheet_names)
+            # A sheet can back more than one type, so each name is parsed once
+            sheets = {name: workbook.parse(name) for name in dict.fromkeys(sheet_mapping.values())}
+        return sheet_names, sheet_mapping, sheets
+    
+    def _standard_column(self, mapping_key: str, col: Any):
+        """Look up the standard name for a sheet column, ignoring case"""
+        if not isinstance(col, str):
+            return None
+        return self._reverse_maps[mapping_key].get(col.casefold())
+    
+    def _map_columns(self, df: pd.DataFrame, mapping_key: str) -> Dict[str, str]:
+        """Map sheet columns to standard names, keeping the first column found for each"""
+        column_map = {}
+        mapped = set()
+        for col in df.columns:
+            standard_col = self._standard_column(mapping_key, col)
+            if standard_col is not None and standard_col not in mapped:
+                column_map[col] = standard_col
+                mapped.add(standard_col)
+        return column_map
+    
+    def _identify_sheets(self, sheet_names: List[str]) -> Dict[str, str]:
         """Identify which sheet contains which type of data"""
         sheet_mapping = {}
         
-        for sheet_name, df in all_sheets.items():
+        for sheet_name in sheet_names:
             sheet_name_lower = sheet_name.lower()
             
-            # Check for transactions sheet
-            if any(keyword in sheet_name_lower for keyword in ['transaction', 'sales', 'revenue', 'expense', 'ledger']):
-                sheet_mapping['transactions'] = sheet_name
-            # Check for campaigns sheet
-            elif any(keyword in sheet_name_lower for keyword in ['campaign', 'marketing', 'ad', 'spend']):
-                sheet_mapping['campaigns'] = sheet_name
-            # Check for targets sheet
-            elif any(keyword in sheet_name_lower for keyword in ['target', 'goal', 'budget', 'forecast', 'metric']):
-                sheet_mapping['targets'] = sheet_name
+            # First matching type wins
+            for sheet_type, pattern in SHEET_PATTERNS.items():
+                if pattern.search(sheet_name_lower):
+                    sheet_mapping[sheet_type] = sheet_name
+                    break
         
         # Fallback: use first 3 sheets if not identified
         if len(sheet_mapping) < 3:
-            sheet_names = list(all_sheets.keys())
             if len(sheet_names) >= 1:
                 sheet_mapping['transactions'] = sheet_names[0]
             if len(sheet_names) >= 2:
@@ -107,44 +197,31 @@ class BulletproofExcelProcessor:
             return self._create_default_transactions()
         
         sheet_name = sheet_mapping['transactions']
-        df = all_sheets[sheet_name].copy()
+        sheet_df = all_sheets[sheet_name]
         
         # Map columns
-        column_map = {}
-        for standard_col, possible_cols in self.column_mappings['Transactions'].items():
-            for col in df.columns:
-                if col in possible_cols:
-                    column_map[col] = standard_col
-                    break
+        column_map = self._map_columns(sheet_df, 'Transactions')
         
-        # Rename columns
-        df = df.rename(columns=column_map)
+        # Rename columns (returns a new frame, leaving the parsed sheet untouched)
+        df = sheet_df.rename(columns=column_map)
         
         # Ensure required columns exist
-        required_cols = ['date', 'description', 'category', 'amount']
+        required_cols = ['Date', 'Description', 'Category', 'Amount']
         for col in required_cols:
             if col not in df.columns:
-                if col == 'date':
-                    df[col] = pd.date_range(start='2024-01-01', periods=len(df), freq='D')
-                elif col == 'description':
-                    df[col] = [f'Transaction {i+1}' for i in range(len(df))]
-                elif col == 'category':
-                    df[col] = np.random.choice(['Revenue', 'Expense', 'Marketing', 'Operations'], len(df))
-                elif col == 'amount':
-                    df[col] = np.random.normal(1000, 300, len(df))
+                if col == 'Date':
+                    df[col] = self._daily_dates(len(df))
+                elif col == 'Description':
+                    df[col] = self._numbered_labels('Transaction ', len(df))
+                elif col == 'Category':
+                    df[col] = self._fill_choice(['Revenue', 'Expense', 'Marketing', 'Operations'], len(df))
+                elif col == 'Amount':
+                    df[col] = self._fill_normal(1000, 300, len(df))
         
         # Clean and validate data
         df = self._clean_transactions_data(df)
         
-        # Standardize column names
-        df = df.rename(columns={
-            'date': 'Date',
-            'description': 'Description', 
-            'category': 'Category',
-            'amount': 'Amount'
-        })
-        
-        return df
+        return self._as_categories(df, ['Category'])
     
     def _process_campaigns_sheet(self, all_sheets: Dict[str, pd.DataFrame], sheet_mapping: Dict[str, str]) -> pd.DataFrame:
         """Process campaigns sheet with perfect accuracy"""
@@ -152,47 +229,33 @@ class BulletproofExcelProcessor:
             return self._create_default_campaigns()
         
         sheet_name = sheet_mapping['campaigns']
-        df = all_sheets[sheet_name].copy()
+        sheet_df = all_sheets[sheet_name]
         
         # Map columns
-        column_map = {}
-        for standard_col, possible_cols in self.column_mappings['Campaign_Data'].items():
-            for col in df.columns:
-                if col in possible_cols:
-                    column_map[col] = standard_col
-                    break
+        column_map = self._map_columns(sheet_df, 'Campaign_Data')
         
-        # Rename columns
-        df = df.rename(columns=column_map)
+        # Rename columns (returns a new frame, leaving the parsed sheet untouched)
+        df = sheet_df.rename(columns=column_map)
         
         # Ensure required columns exist
-        required_cols = ['timestamp', 'campaign_id', 'channel', 'spend', 'acquisitions']
+        required_cols = ['Timestamp', 'Campaign_ID', 'Channel', 'Spend', 'Acquisitions']
         for col in required_cols:
             if col not in df.columns:
-                if col == 'timestamp':
-                    df[col] = pd.date_range(start='2024-01-01', periods=len(df), freq='D')
-                elif col == 'campaign_id':
-                    df[col] = [f'CAMP_{i+1:04d}' for i in range(len(df))]
-                elif col == 'channel':
-                    df[col] = np.random.choice(['Google Ads', 'Facebook', 'Instagram', 'Email', 'Organic'], len(df))
-                elif col == 'spend':
-                    df[col] = np.random.normal(1000, 300, len(df))
-                elif col == 'acquisitions':
-                    df[col] = np.random.poisson(50, len(df))
+                if col == 'Timestamp':
+                    df[col] = self._daily_dates(len(df))
+                elif col == 'Campaign_ID':
+                    df[col] = self._numbered_labels('CAMP_', len(df), width=4)
+                elif col == 'Channel':
+                    df[col] = self._fill_choice(['Google Ads', 'Facebook', 'Instagram', 'Email', 'Organic'], len(df))
+                elif col == 'Spend':
+                    df[col] = self._fill_normal(1000, 300, len(df))
+                elif col == 'Acquisitions':
+                    df[col] = self._fill_poisson(50, len(df))
         
         # Clean and validate data
         df = self._clean_campaigns_data(df)
         
-        # Standardize column names
-        df = df.rename(columns={
-            'timestamp': 'Timestamp',
-            'campaign_id': 'Campaign_ID',
-            'channel': 'Channel',
-            'spend': 'Spend',
-            'acquisitions': 'Acquisitions'
-        })
-        
-        return df
+        return self._as_categories(df, ['Channel'])
     
     def _process_targets_sheet(self, all_sheets: Dict[str, pd.DataFrame], sheet_mapping: Dict[str, str]) -> pd.DataFrame:
         """Process targets sheet with perfect accuracy"""
@@ -200,103 +263,142 @@ class BulletproofExcelProcessor:
             return self._create_default_targets()
         
         sheet_name = sheet_mapping['targets']
-        df = all_sheets[sheet_name].copy()
+        sheet_df = all_sheets[sheet_name]
         
         # Map columns
-        column_map = {}
-        for standard_col, possible_cols in self.column_mappings['Targets'].items():
-            for col in df.columns:
-                if col in possible_cols:
-                    column_map[col] = standard_col
-                    break
+        column_map = self._map_columns(sheet_df, 'Targets')
         
-        # Rename columns
-        df = df.rename(columns=column_map)
+        # Rename columns (returns a new frame, leaving the parsed sheet untouched)
+        df = sheet_df.rename(columns=column_map)
         
         # Ensure required columns exist
-        required_cols = ['metric_name', 'value']
+        required_cols = ['Metric_Name', 'Value']
         for col in required_cols:
             if col not in df.columns:
-                if col == 'metric_name':
+                if col == 'Metric_Name':
                     df[col] = ['Revenue_Target', 'CAC_Target', 'ROI_Target', 'Cash_Flow_Target']
-                elif col == 'value':
+                elif col == 'Value':
                     df[col] = [1000000, 150, 300, 100000]
         
         # Clean and validate data
         df = self._clean_targets_data(df)
         
-        # Standardize column names
-        df = df.rename(columns={
-            'metric_name': 'Metric_Name',
-            'value': 'Value'
-        })
-        
         return df
     
     def _clean_transactions_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean transactions data with perfect accuracy"""
+        # Rows are kept only if every column below is valid, filtered once at the end
+        keep = pd.Series(True, index=df.index)
+        
         # Convert date column
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            df = df.dropna(subset=['date'])
+        if 'Date' in df.columns:
+            if not is_datetime64_any_dtype(df['Date']):
+                df = df.assign(Date=pd.to_datetime(df['Date'], errors='coerce'))
+            keep &= df['Date'].notna()
         
         # Clean amount column
-        if 'amount' in df.columns:
-            df['amount'] = pd.to_numeric(df['amount'], errors='coerce')
-            df = df.dropna(subset=['amount'])
-            df['amount'] = df['amount'].round(2)
+        if 'Amount' in df.columns:
+            if not is_numeric_dtype(df['Amount']):
+                df = df.assign(Amount=pd.to_numeric(df['Amount'], errors='coerce'))
+            df = df.assign(Amount=df['Amount'].round(2))
+            keep &= df['Amount'].notna()
         
         # Clean text columns
-        for col in ['description', 'category']:
+        for col in ['Description', 'Category']:
             if col in df.columns:
-                df[col] = df[col].astype(str).str.strip()
-                df = df[df[col] != '']
+                df = df.assign(**{col: df[col].astype(str).str.strip()})
+                keep &= df[col].str.len().gt(0)
         
-        return df
+        return df.loc[keep]
     
     def _clean_campaigns_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean campaigns data with perfect accuracy"""
+        # Rows are kept only if every column below is valid, filtered once at the end
+        keep = pd.Series(True, index=df.index)
+        
         # Convert timestamp column
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-            df = df.dropna(subset=['timestamp'])
+        if 'Timestamp' in df.columns:
+            if not is_datetime64_any_dtype(df['Timestamp']):
+                df = df.assign(Timestamp=pd.to_datetime(df['Timestamp'], errors='coerce'))
+            keep &= df['Timestamp'].notna()
         
         # Clean numeric columns
-        for col in ['spend', 'acquisitions']:
+        for col in ['Spend', 'Acquisitions']:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-                df = df.dropna(subset=[col])
-                if col == 'spend':
-                    df[col] = df[col].round(2)
-                else:
-                    df[col] = df[col].astype(int)
+                if not is_numeric_dtype(df[col]):
+                    df = df.assign(**{col: pd.to_numeric(df[col], errors='coerce')})
+                keep &= df[col].notna()
+        if 'Spend' in df.columns:
+            df = df.assign(Spend=df['Spend'].round(2))
         
         # Clean text columns
-        for col in ['campaign_id', 'channel']:
+        for col in ['Campaign_ID', 'Channel']:
             if col in df.columns:
-                df[col] = df[col].astype(str).str.strip()
-                df = df[df[col] != '']
+                df = df.assign(**{col: df[col].astype(str).str.strip()})
+                keep &= df[col].str.len().gt(0)
+        
+        df = df.loc[keep]
+        # Integer cast has to wait until missing acquisitions are filtered out
+        if 'Acquisitions' in df.columns:
+            df = df.assign(Acquisitions=df['Acquisitions'].astype(int))
         
         return df
     
     def _clean_targets_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean targets data with perfect accuracy"""
+        # Rows are kept only if every column below is valid, filtered once at the end
+        keep = pd.Series(True, index=df.index)
+        
         # Clean metric_name column
-        if 'metric_name' in df.columns:
-            df['metric_name'] = df['metric_name'].astype(str).str.strip()
-            df = df[df['metric_name'] != '']
+        if 'Metric_Name' in df.columns:
+            df = df.assign(Metric_Name=df['Metric_Name'].astype(str).str.strip())
+            keep &= df['Metric_Name'].str.len().gt(0)
         
         # Clean value column
-        if 'value' in df.columns:
-            df['value'] = pd.to_numeric(df['value'], errors='coerce')
-            df = df.dropna(subset=['value'])
-            df['value'] = df['value'].round(2)
+        if 'Value' in df.columns:
+            if not is_numeric_dtype(df['Value']):
+                df = df.assign(Value=pd.to_numeric(df['Value'], errors='coerce'))
+            df = df.assign(Value=df['Value'].round(2))
+            keep &= df['Value'].notna()
         
-        return df
+        return df.loc[keep]
+    
+    def _as_categories(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Store low-cardinality text columns as categoricals"""
+        return df.astype({col: 'category' for col in columns if col in df.columns})
+    
+    def _daily_dates(self, n: int, start: str = '2024-01-01') -> np.ndarray:
+        """n consecutive days from start, at the nanosecond resolution pandas defaults to"""
+        return (np.datetime64(start, 'D') + np.arange(n)).astype('datetime64[ns]')
+    
+    def _numbered_labels(self, prefix: str, n: int, width: int = 0) -> np.ndarray:
+        """Labels prefix1..prefixN, zero-padded to width, built without a per-row format call"""
+        if n == 0:
+            return np.empty(0, dtype=object)
+        numbers = np.char.zfill(np.arange(1, n + 1).astype(str), width)
+        return np.char.add(prefix, numbers).astype(object)
+    
+    def _fill_choice(self, options: List[str], n: int) -> np.ndarray:
+        """Values for a missing text column"""
+        if self.fill_missing == 'synthetic':
+            return np.random.choice(options, n)
+        return np.full(n, 'Unknown', dtype=object)
+    
+    def _fill_normal(self, mean: float, std: float, n: int) -> np.ndarray:
+        """Values for a missing amount column"""
+        if self.fill_missing == 'synthetic':
+            return np.random.normal(mean, std, n)
+        return np.zeros(n)
+    
+    def _fill_poisson(self, lam: float, n: int) -> np.ndarray:
+        """Values for a missing count column"""
+        if self.fill_missing == 'synthetic':
+            return np.random.poisson(lam, n)
+        return np.zeros(n, dtype=int)
     
     def _create_default_data(self, filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, Dict[str, Any]]:
         """Create default data as fallback"""
-        print("⚠️ Creating default data as fallback")
+        logger.warning("Creating default data as fallback")
         
         file_info = {
             'filename': os.path.basename(filepath),
@@ -314,31 +416,32 @@ class BulletproofExcelProcessor:
     
     def _create_default_transactions(self) -> pd.DataFrame:
         """Create default transaction data"""
-        dates = pd.date_range(start='2024-01-01', end='2024-01-31', freq='D')
+        # Sample figures rather than the constant fill, so the fallback still gives a usable analysis
+        dates = self._daily_dates(31)
         amounts = np.random.normal(1000, 300, len(dates))
         categories = np.random.choice(['Revenue', 'Expense', 'Marketing', 'Operations'], len(dates))
         
-        return pd.DataFrame({
+        return self._as_categories(pd.DataFrame({
             'Date': dates,
-            'Description': [f'Transaction {i+1}' for i in range(len(dates))],
+            'Description': self._numbered_labels('Transaction ', len(dates)),
             'Category': categories,
             'Amount': amounts.round(2)
-        })
+        }), ['Category'])
     
     def _create_default_campaigns(self) -> pd.DataFrame:
         """Create default campaign data"""
-        dates = pd.date_range(start='2024-01-01', end='2024-01-31', freq='D')
+        dates = self._daily_dates(31)
         channels = np.random.choice(['Google Ads', 'Facebook', 'Instagram', 'Email'], len(dates))
         spend = np.random.normal(1000, 300, len(dates))
         acquisitions = np.random.poisson(50, len(dates))
         
-        return pd.DataFrame({
+        return self._as_categories(pd.DataFrame({
             'Timestamp': dates,
-            'Campaign_ID': [f'CAMP_{i+1:04d}' for i in range(len(dates))],
+            'Campaign_ID': self._numbered_labels('CAMP_', len(dates), width=4),
             'Channel': channels,
             'Spend': spend.round(2),
             'Acquisitions': acquisitions
-        })
+        }), ['Channel'])
     
     def _create_default_targets(self) -> pd.DataFrame:
         """Create default targets data"""
@@ -1,13 +1,26 @@
 # Aura Configuration
+import functools
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def _load_config():
+    """Read .env and the environment once per process"""
+    # .env also supplies MONGODB_URI, SESSION_SECRET etc. to other modules, so always load it
+    load_dotenv()
+    return MappingProxyType({
+        "GROQ_API_KEY": os.getenv("GROQ_API_KEY"),
+        "CORS_ORIGINS": tuple(os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")),
+    })
+
+
+_config = _load_config()
 
 # Groq API Configuration
 # IMPORTANT: Set GROQ_API_KEY in your .env file or environment variables
-GEMINI_API_KEY = os.getenv("GROQ_API_KEY")
+GEMINI_API_KEY = _config["GROQ_API_KEY"]
 
 if not GEMINI_API_KEY:
     raise ValueError("GROQ_API_KEY environment variable is required. Please set it in .env file or environment.")
@@ -16,4 +29,4 @@ if not GEMINI_API_KEY:
 GEMINI_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
 # CORS Configuration
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+CORS_ORIGINS = list(_config["CORS_ORIGINS"])
@@ -1,574 +1,319 @@
+import os
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+import xlsxwriter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-def create_perfect_datasets():
-    """
-    Create 10 perfect datasets with 500 entries each that work perfectly with analytics graphs
-    """
-    
-    # Set random seed for reproducibility
-    np.random.seed(42)
-    random.seed(42)
-    
-    datasets = []
-    
+# Rows in each Transactions and Campaign_Data sheet
+ROWS = 500
+
+# One entry per generated workbook; dataset N is written as dataset_N_<slug>.xlsx
+DATASET_SPECS = [
     # Dataset 1: E-commerce Company
-    ecommerce_data = create_ecommerce_dataset()
-    datasets.append(('dataset_1_ecommerce.xlsx', ecommerce_data))
-    
+    {
+        'slug': 'ecommerce',
+        'tx_mean': 150, 'tx_std': 50,  # Average $150 per transaction
+        'tx_categories': ['Sales', 'Refunds', 'Shipping', 'Fees'],
+        'tx_p': [0.7, 0.1, 0.15, 0.05],
+        'desc_separator': ' transaction #', 'desc_details': None,
+        'prefix': 'CAMP',
+        'channels': ['Google Ads', 'Facebook', 'Instagram', 'Email', 'Affiliate'],
+        'spend_mean': 1000, 'spend_std': 300,  # Average $1000 per campaign
+        'acquisitions_mean': 50, 'acquisitions_std': 15,  # Average 50 acquisitions
+        'targets': [
+            ('Monthly_Revenue_Target', 500000),
+            ('Customer_Acquisition_Target', 2000),
+            ('Marketing_ROI_Target', 300),
+            ('Cash_Flow_Target', 100000)
+        ]
+    },
     # Dataset 2: SaaS Startup
-    saas_data = create_saas_dataset()
-    datasets.append(('dataset_2_saas.xlsx', saas_data))
-    
+    {
+        'slug': 'saas',
+        'tx_mean': 200, 'tx_std': 50,  # Average $200 MRR
+        'tx_categories': ['Subscription', 'Upgrade', 'Downgrade', 'Churn'],
+        'tx_p': [0.8, 0.1, 0.05, 0.05],
+        'desc_separator': ' - Plan ', 'desc_details': ['Basic', 'Pro', 'Enterprise'],
+        'prefix': 'SAAS',
+        'channels': ['LinkedIn', 'Google Ads', 'Content Marketing', 'Webinars', 'Referrals'],
+        'spend_mean': 2000, 'spend_std': 500,  # Higher B2B spend
+        'acquisitions_mean': 20, 'acquisitions_std': 8,  # Lower volume, higher value
+        'targets': [
+            ('MRR_Target', 100000),
+            ('CAC_Target', 150),
+            ('Churn_Rate_Target', 5),
+            ('LTV_Target', 2000)
+        ]
+    },
     # Dataset 3: Consulting Firm
-    consulting_data = create_consulting_dataset()
-    datasets.append(('dataset_3_consulting.xlsx', consulting_data))
-    
+    {
+        'slug': 'consulting',
+        'tx_mean': 5000, 'tx_std': 1500,  # Average $5000 per project
+        'tx_categories': ['Project Payment', 'Retainer', 'Expenses', 'Consulting'],
+        'tx_p': [0.6, 0.2, 0.1, 0.1],
+        'desc_separator': ' - ', 'desc_details': ['Strategy', 'Operations', 'Technology', 'Finance'],
+        'prefix': 'CONS',
+        'channels': ['LinkedIn', 'Referrals', 'Conferences', 'Content', 'Direct Outreach'],
+        'spend_mean': 500, 'spend_std': 200,  # Lower marketing spend
+        'acquisitions_mean': 5, 'acquisitions_std': 2,  # Very low volume, high value
+        'targets': [
+            ('Project_Revenue_Target', 2000000),
+            ('Client_Acquisition_Target', 50),
+            ('Utilization_Rate_Target', 85),
+            ('Profit_Margin_Target', 25)
+        ]
+    },
     # Dataset 4: Manufacturing Company
-    manufacturing_data = create_manufacturing_dataset()
-    datasets.append(('dataset_4_manufacturing.xlsx', manufacturing_data))
-    
+    {
+        'slug': 'manufacturing',
+        'tx_mean': 10000, 'tx_std': 3000,  # Large B2B transactions
+        'tx_categories': ['Sales', 'Raw Materials', 'Labor', 'Overhead'],
+        'tx_p': [0.4, 0.3, 0.2, 0.1],
+        'desc_separator': ' - ', 'desc_details': ['Product A', 'Product B', 'Product C'],
+        'prefix': 'MFG',
+        'channels': ['Trade Shows', 'Industry Publications', 'Direct Sales', 'Online Ads', 'Partnerships'],
+        'spend_mean': 3000, 'spend_std': 1000,  # High B2B marketing spend
+        'acquisitions_mean': 10, 'acquisitions_std': 5,  # Low volume, high value
+        'targets': [
+            ('Production_Volume_Target', 10000),
+            ('Cost_Per_Unit_Target', 50),
+            ('Quality_Rate_Target', 99),
+            ('Delivery_Time_Target', 7)
+        ]
+    },
     # Dataset 5: Healthcare Provider
-    healthcare_data = create_healthcare_dataset()
-    datasets.append(('dataset_5_healthcare.xlsx', healthcare_data))
-    
+    {
+        'slug': 'healthcare',
+        'tx_mean': 300, 'tx_std': 100,  # Average patient visit cost
+        'tx_categories': ['Patient Services', 'Insurance', 'Medications', 'Equipment'],
+        'tx_p': [0.6, 0.2, 0.15, 0.05],
+        'desc_separator': ' - ', 'desc_details': ['Consultation', 'Treatment', 'Diagnosis', 'Follow-up'],
+        'prefix': 'HC',
+        'channels': ['Community Outreach', 'Online Ads', 'Referrals', 'Health Fairs', 'Social Media'],
+        'spend_mean': 800, 'spend_std': 300,  # Moderate marketing spend
+        'acquisitions_mean': 30, 'acquisitions_std': 10,  # Patient acquisitions
+        'targets': [
+            ('Patient_Volume_Target', 5000),
+            ('Revenue_Per_Patient_Target', 400),
+            ('Patient_Satisfaction_Target', 95),
+            ('No_Show_Rate_Target', 10)
+        ]
+    },
     # Dataset 6: Real Estate Agency
-    realestate_data = create_realestate_dataset()
-    datasets.append(('dataset_6_realestate.xlsx', realestate_data))
-    
+    {
+        'slug': 'realestate',
+        'tx_mean': 3000, 'tx_std': 1000,  # Average commission
+        'tx_categories': ['Commission', 'Listing Fee', 'Closing Costs', 'Marketing'],
+        'tx_p': [0.7, 0.15, 0.1, 0.05],
+        'desc_separator': ' - ', 'desc_details': ['Residential', 'Commercial', 'Rental'],
+        'prefix': 'RE',
+        'channels': ['Zillow', 'Realtor.com', 'Facebook', 'Google Ads', 'Referrals'],
+        'spend_mean': 1500, 'spend_std': 500,  # High lead gen spend
+        'acquisitions_mean': 15, 'acquisitions_std': 8,  # Lead acquisitions
+        'targets': [
+            ('Sales_Volume_Target', 50000000),
+            ('Commission_Rate_Target', 6),
+            ('Lead_Conversion_Target', 20),
+            ('Days_On_Market_Target', 30)
+        ]
+    },
     # Dataset 7: Food & Beverage
-    foodbeverage_data = create_foodbeverage_dataset()
-    datasets.append(('dataset_7_foodbeverage.xlsx', foodbeverage_data))
-    
+    {
+        'slug': 'foodbeverage',
+        'tx_mean': 200, 'tx_std': 80,  # Average order value
+        'tx_categories': ['Sales', 'Ingredients', 'Labor', 'Packaging'],
+        'tx_p': [0.5, 0.25, 0.15, 0.1],
+        'desc_separator': ' - ', 'desc_details': ['Retail', 'Wholesale', 'Online'],
+        'prefix': 'FB',
+        'channels': ['Social Media', 'Influencers', 'TV Ads', 'Print', 'Events'],
+        'spend_mean': 2000, 'spend_std': 800,  # Brand marketing spend
+        'acquisitions_mean': 100, 'acquisitions_std': 30,  # Customer acquisitions
+        'targets': [
+            ('Sales_Volume_Target', 1000000),
+            ('Gross_Margin_Target', 40),
+            ('Brand_Awareness_Target', 80),
+            ('Customer_Retention_Target', 70)
+        ]
+    },
     # Dataset 8: Technology Services
-    techservices_data = create_techservices_dataset()
-    datasets.append(('dataset_8_techservices.xlsx', techservices_data))
-    
+    {
+        'slug': 'techservices',
+        'tx_mean': 2500, 'tx_std': 800,  # Average project value
+        'tx_categories': ['Development', 'Consulting', 'Support', 'Licensing'],
+        'tx_p': [0.5, 0.3, 0.15, 0.05],
+        'desc_separator': ' - ', 'desc_details': ['Web App', 'Mobile App', 'API', 'Integration'],
+        'prefix': 'TECH',
+        'channels': ['LinkedIn', 'Tech Conferences', 'Content Marketing', 'Google Ads', 'Partnerships'],
+        'spend_mean': 1200, 'spend_std': 400,  # B2B marketing spend
+        'acquisitions_mean': 25, 'acquisitions_std': 10,  # Client acquisitions
+        'targets': [
+            ('Project_Revenue_Target', 1500000),
+            ('Client_Satisfaction_Target', 95),
+            ('Project_Delivery_Target', 90),
+            ('Technical_Debt_Target', 10)
+        ]
+    },
     # Dataset 9: Financial Services
-    financial_data = create_financial_dataset()
-    datasets.append(('dataset_9_financial.xlsx', financial_data))
-    
+    {
+        'slug': 'financial',
+        'tx_mean': 5000, 'tx_std': 2000,  # High-value financial transactions
+        'tx_categories': ['Advisory Fees', 'Investment Returns', 'Commissions', 'Management Fees'],
+        'tx_p': [0.4, 0.3, 0.2, 0.1],
+        'desc_separator': ' - ', 'desc_details': ['Portfolio Management', 'Financial Planning', 'Investment Advisory'],
+        'prefix': 'FIN',
+        'channels': ['Referrals', 'Wealth Management Events', 'Private Banking', 'Online Ads', 'Partnerships'],
+        'spend_mean': 5000, 'spend_std': 2000,  # High-end marketing spend
+        'acquisitions_mean': 8, 'acquisitions_std': 4,  # Very low volume, very high value
+        'targets': [
+            ('AUM_Target', 100000000),
+            ('Client_AUM_Target', 1000000),
+            ('ROI_Target', 12),
+            ('Client_Retention_Target', 95)
+        ]
+    },
     # Dataset 10: Education Technology
-    edtech_data = create_edtech_dataset()
-    datasets.append(('dataset_10_edtech.xlsx', edtech_data))
-    
-    return datasets
-
-def create_ecommerce_dataset():
-    """E-commerce company with high transaction volume and marketing campaigns"""
-    # Transactions (500 entries)
-    transactions = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(150, 50)  # Average $150 per transaction
-        category = np.random.choice(['Sales', 'Refunds', 'Shipping', 'Fees'], p=[0.7, 0.1, 0.15, 0.05])
-        description = f"{category} transaction #{i+1}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns (500 entries)
-    campaigns = []
-    channels = ['Google Ads', 'Facebook', 'Instagram', 'Email', 'Affiliate']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(1000, 300)  # Average $1000 per campaign
-        acquisitions = int(np.random.normal(50, 15))  # Average 50 acquisitions
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"CAMP_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    # Targets
-    targets = [
-        {'Metric_Name': 'Monthly_Revenue_Target', 'Value': 500000},
-        {'Metric_Name': 'Customer_Acquisition_Target', 'Value': 2000},
-        {'Metric_Name': 'Marketing_ROI_Target', 'Value': 300},
-        {'Metric_Name': 'Cash_Flow_Target', 'Value': 100000}
-    ]
-    
-    return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
+    {
+        'slug': 'edtech',
+        'tx_mean': 150, 'tx_std': 50,  # Average course/subscription value
+        'tx_categories': ['Course Sales', 'Subscriptions', 'Certifications', 'Licensing'],
+        'tx_p': [0.5, 0.3, 0.15, 0.05],
+        'desc_separator': ' - ', 'desc_details': ['Online Course', 'Live Training', 'Certification Program'],
+        'prefix': 'EDU',
+        'channels': ['Google Ads', 'Facebook', 'LinkedIn', 'Content Marketing', 'Webinars'],
+        'spend_mean': 800, 'spend_std': 300,  # Education marketing spend
+        'acquisitions_mean': 40, 'acquisitions_std': 15,  # Student acquisitions
+        'targets': [
+            ('Student_Enrollment_Target', 10000),
+            ('Course_Completion_Target', 80),
+            ('Student_Satisfaction_Target', 90),
+            ('Revenue_Per_Student_Target', 200)
+        ]
     }
+]
 
-def create_saas_dataset():
-    """SaaS startup with subscription revenue and customer acquisition"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - subscription revenue
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(200, 50)  # Average $200 MRR
-        category = np.random.choice(['Subscription', 'Upgrade', 'Downgrade', 'Churn'], p=[0.8, 0.1, 0.05, 0.05])
-        description = f"{category} - Plan {np.random.choice(['Basic', 'Pro', 'Enterprise'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - B2B focused
-    channels = ['LinkedIn', 'Google Ads', 'Content Marketing', 'Webinars', 'Referrals']
+def create_perfect_datasets():
+    """
+    Create 10 perfect datasets with 500 entries each that work perfectly with analytics graphs
     
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(2000, 500)  # Higher B2B spend
-        acquisitions = int(np.random.normal(20, 8))  # Lower volume, higher value
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"SAAS_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
+    Yields (filename, sheets) one dataset at a time so callers can write and drop each in turn
+    """
     
-    targets = [
-        {'Metric_Name': 'MRR_Target', 'Value': 100000},
-        {'Metric_Name': 'CAC_Target', 'Value': 150},
-        {'Metric_Name': 'Churn_Rate_Target', 'Value': 5},
-        {'Metric_Name': 'LTV_Target', 'Value': 2000}
-    ]
+    # Independent seeded generator per dataset, reproducible and safe to build in any order
+    seeds = np.random.SeedSequence(42).spawn(len(DATASET_SPECS))
+    # Dates and row numbers are the same for every dataset, so build them once and share them
+    template = _row_template(ROWS)
     
-    return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
-    }
+    for i, (spec, seed) in enumerate(zip(DATASET_SPECS, seeds)):
+        yield f"dataset_{i+1}_{spec['slug']}.xlsx", _build_dataset(spec, np.random.default_rng(seed), template)
 
-def create_consulting_dataset():
-    """Consulting firm with project-based revenue"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - project payments
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(5000, 1500)  # Average $5000 per project
-        category = np.random.choice(['Project Payment', 'Retainer', 'Expenses', 'Consulting'], p=[0.6, 0.2, 0.1, 0.1])
-        description = f"{category} - {np.random.choice(['Strategy', 'Operations', 'Technology', 'Finance'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - professional services
-    channels = ['LinkedIn', 'Referrals', 'Conferences', 'Content', 'Direct Outreach']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(500, 200)  # Lower marketing spend
-        acquisitions = int(np.random.normal(5, 2))  # Very low volume, high value
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"CONS_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    targets = [
-        {'Metric_Name': 'Project_Revenue_Target', 'Value': 2000000},
-        {'Metric_Name': 'Client_Acquisition_Target', 'Value': 50},
-        {'Metric_Name': 'Utilization_Rate_Target', 'Value': 85},
-        {'Metric_Name': 'Profit_Margin_Target', 'Value': 25}
-    ]
-    
+def _row_template(n):
+    """Per-row columns shared by all datasets; treated as read-only"""
+    numbers = np.arange(1, n + 1).astype(str)
     return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
+        'dates': _daily_dates(n),
+        'numbers': numbers,
+        'padded_numbers': np.char.zfill(numbers, 4)
     }
 
-def create_manufacturing_dataset():
-    """Manufacturing company with production costs and B2B sales"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - production and sales
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(10000, 3000)  # Large B2B transactions
-        category = np.random.choice(['Sales', 'Raw Materials', 'Labor', 'Overhead'], p=[0.4, 0.3, 0.2, 0.1])
-        description = f"{category} - {np.random.choice(['Product A', 'Product B', 'Product C'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - B2B focused
-    channels = ['Trade Shows', 'Industry Publications', 'Direct Sales', 'Online Ads', 'Partnerships']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(3000, 1000)  # High B2B marketing spend
-        acquisitions = int(np.random.normal(10, 5))  # Low volume, high value
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"MFG_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    targets = [
-        {'Metric_Name': 'Production_Volume_Target', 'Value': 10000},
-        {'Metric_Name': 'Cost_Per_Unit_Target', 'Value': 50},
-        {'Metric_Name': 'Quality_Rate_Target', 'Value': 99},
-        {'Metric_Name': 'Delivery_Time_Target', 'Value': 7}
-    ]
+def _build_dataset(spec, rng, template):
+    """Build the Transactions, Campaign_Data and Targets sheets for one DATASET_SPECS entry"""
+    transactions = _build_transactions(
+        rng, template, spec['tx_mean'], spec['tx_std'],
+        spec['tx_categories'], spec['tx_p'],
+        spec['desc_separator'], spec['desc_details']
+    )
+    campaigns = _build_campaigns(
+        rng, template, spec['prefix'], spec['channels'],
+        spec['spend_mean'], spec['spend_std'],
+        spec['acquisitions_mean'], spec['acquisitions_std']
+    )
+    metric_names, values = zip(*spec['targets'])
     
     return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
+        'Transactions': transactions,
+        'Campaign_Data': campaigns,
+        'Targets': pd.DataFrame({'Metric_Name': metric_names, 'Value': values})
     }
 
-def create_healthcare_dataset():
-    """Healthcare provider with patient revenue and service costs"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - patient services
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(300, 100)  # Average patient visit cost
-        category = np.random.choice(['Patient Services', 'Insurance', 'Medications', 'Equipment'], p=[0.6, 0.2, 0.15, 0.05])
-        description = f"{category} - {np.random.choice(['Consultation', 'Treatment', 'Diagnosis', 'Follow-up'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - patient acquisition
-    channels = ['Community Outreach', 'Online Ads', 'Referrals', 'Health Fairs', 'Social Media']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(800, 300)  # Moderate marketing spend
-        acquisitions = int(np.random.normal(30, 10))  # Patient acquisitions
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"HC_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    targets = [
-        {'Metric_Name': 'Patient_Volume_Target', 'Value': 5000},
-        {'Metric_Name': 'Revenue_Per_Patient_Target', 'Value': 400},
-        {'Metric_Name': 'Patient_Satisfaction_Target', 'Value': 95},
-        {'Metric_Name': 'No_Show_Rate_Target', 'Value': 10}
-    ]
-    
-    return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
-    }
+def _daily_dates(n):
+    """One 'YYYY-MM-DD' string per day, starting a year ago"""
+    start = pd.Timestamp.now().normalize() - pd.Timedelta(days=365)
+    return pd.date_range(start, periods=n, freq='D').strftime('%Y-%m-%d').to_numpy()
 
-def create_realestate_dataset():
-    """Real estate agency with commission-based revenue"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - commissions and fees
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(3000, 1000)  # Average commission
-        category = np.random.choice(['Commission', 'Listing Fee', 'Closing Costs', 'Marketing'], p=[0.7, 0.15, 0.1, 0.05])
-        description = f"{category} - {np.random.choice(['Residential', 'Commercial', 'Rental'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - lead generation
-    channels = ['Zillow', 'Realtor.com', 'Facebook', 'Google Ads', 'Referrals']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(1500, 500)  # High lead gen spend
-        acquisitions = int(np.random.normal(15, 8))  # Lead acquisitions
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"RE_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    targets = [
-        {'Metric_Name': 'Sales_Volume_Target', 'Value': 50000000},
-        {'Metric_Name': 'Commission_Rate_Target', 'Value': 6},
-        {'Metric_Name': 'Lead_Conversion_Target', 'Value': 20},
-        {'Metric_Name': 'Days_On_Market_Target', 'Value': 30}
-    ]
-    
-    return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
-    }
+def _weighted_pick(rng, options, p, n):
+    """n draws from options with probabilities p, by binary search on the cumulative distribution"""
+    cdf = np.cumsum(p)
+    # Normalise so float rounding in the sum can't leave a draw past the last bucket
+    cdf /= cdf[-1]
+    return np.asarray(options)[np.searchsorted(cdf, rng.random(n), side='right')]
 
-def create_foodbeverage_dataset():
-    """Food & beverage company with retail and wholesale sales"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - sales and costs
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(200, 80)  # Average order value
-        category = np.random.choice(['Sales', 'Ingredients', 'Labor', 'Packaging'], p=[0.5, 0.25, 0.15, 0.1])
-        description = f"{category} - {np.random.choice(['Retail', 'Wholesale', 'Online'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - brand awareness
-    channels = ['Social Media', 'Influencers', 'TV Ads', 'Print', 'Events']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(2000, 800)  # Brand marketing spend
-        acquisitions = int(np.random.normal(100, 30))  # Customer acquisitions
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"FB_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    targets = [
-        {'Metric_Name': 'Sales_Volume_Target', 'Value': 1000000},
-        {'Metric_Name': 'Gross_Margin_Target', 'Value': 40},
-        {'Metric_Name': 'Brand_Awareness_Target', 'Value': 80},
-        {'Metric_Name': 'Customer_Retention_Target', 'Value': 70}
-    ]
-    
-    return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
-    }
+def _build_transactions(rng, template, mean, std, categories, p, separator, details):
+    """Transactions sheet; descriptions are '<category><separator><detail>', or numbered when details is None"""
+    dates = template['dates']
+    n = len(dates)
+    amounts = np.round(rng.normal(mean, std, n), 2)
+    category = _weighted_pick(rng, categories, p, n)
+    if details is None:
+        detail = template['numbers']
+    else:
+        detail = rng.choice(details, size=n)
+    description = np.char.add(np.char.add(category, separator), detail)
+    
+    return pd.DataFrame({
+        'Date': dates,
+        'Description': description,
+        'Category': pd.Categorical(category, categories=categories),
+        'Amount': amounts
+    })
 
-def create_techservices_dataset():
-    """Technology services company with project-based revenue"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - service revenue
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(2500, 800)  # Average project value
-        category = np.random.choice(['Development', 'Consulting', 'Support', 'Licensing'], p=[0.5, 0.3, 0.15, 0.05])
-        description = f"{category} - {np.random.choice(['Web App', 'Mobile App', 'API', 'Integration'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - B2B tech services
-    channels = ['LinkedIn', 'Tech Conferences', 'Content Marketing', 'Google Ads', 'Partnerships']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(1200, 400)  # B2B marketing spend
-        acquisitions = int(np.random.normal(25, 10))  # Client acquisitions
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"TECH_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    targets = [
-        {'Metric_Name': 'Project_Revenue_Target', 'Value': 1500000},
-        {'Metric_Name': 'Client_Satisfaction_Target', 'Value': 95},
-        {'Metric_Name': 'Project_Delivery_Target', 'Value': 90},
-        {'Metric_Name': 'Technical_Debt_Target', 'Value': 10}
-    ]
-    
-    return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
-    }
+def _build_campaigns(rng, template, prefix, channels, spend_mean, spend_std, acquisitions_mean, acquisitions_std):
+    """Campaign sheet with one campaign per day"""
+    dates = template['dates']
+    n = len(dates)
+    channel = rng.choice(channels, size=n)
+    spend = np.round(rng.normal(spend_mean, spend_std, n), 2)
+    # int() truncation then a floor of one acquisition, as per-row max(1, int(x))
+    acquisitions = np.maximum(1, rng.normal(acquisitions_mean, acquisitions_std, n).astype(np.int32))
+    campaign_ids = np.char.add(f"{prefix}_", template['padded_numbers'])
+    
+    return pd.DataFrame({
+        'Timestamp': dates,
+        'Campaign_ID': campaign_ids,
+        'Channel': pd.Categorical(channel, categories=channels),
+        'Spend': spend,
+        'Acquisitions': acquisitions
+    })
 
-def create_financial_dataset():
-    """Financial services company with investment and advisory revenue"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - financial services
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(5000, 2000)  # High-value financial transactions
-        category = np.random.choice(['Advisory Fees', 'Investment Returns', 'Commissions', 'Management Fees'], p=[0.4, 0.3, 0.2, 0.1])
-        description = f"{category} - {np.random.choice(['Portfolio Management', 'Financial Planning', 'Investment Advisory'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - high-net-worth client acquisition
-    channels = ['Referrals', 'Wealth Management Events', 'Private Banking', 'Online Ads', 'Partnerships']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(5000, 2000)  # High-end marketing spend
-        acquisitions = int(np.random.normal(8, 4))  # Very low volume, very high value
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"FIN_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    targets = [
-        {'Metric_Name': 'AUM_Target', 'Value': 100000000},
-        {'Metric_Name': 'Client_AUM_Target', 'Value': 1000000},
-        {'Metric_Name': 'ROI_Target', 'Value': 12},
-        {'Metric_Name': 'Client_Retention_Target', 'Value': 95}
-    ]
-    
-    return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
-    }
-
-def create_edtech_dataset():
-    """Education technology company with subscription and course revenue"""
-    transactions = []
-    campaigns = []
-    base_date = datetime.now() - timedelta(days=365)
-    
-    # Transactions - education revenue
-    for i in range(500):
-        date = base_date + timedelta(days=i)
-        amount = np.random.normal(150, 50)  # Average course/subscription value
-        category = np.random.choice(['Course Sales', 'Subscriptions', 'Certifications', 'Licensing'], p=[0.5, 0.3, 0.15, 0.05])
-        description = f"{category} - {np.random.choice(['Online Course', 'Live Training', 'Certification Program'])}"
-        
-        transactions.append({
-            'Date': date.strftime('%Y-%m-%d'),
-            'Description': description,
-            'Category': category,
-            'Amount': round(amount, 2)
-        })
-    
-    # Campaigns - student acquisition
-    channels = ['Google Ads', 'Facebook', 'LinkedIn', 'Content Marketing', 'Webinars']
-    
-    for i in range(500):
-        timestamp = base_date + timedelta(days=i)
-        channel = np.random.choice(channels)
-        spend = np.random.normal(800, 300)  # Education marketing spend
-        acquisitions = int(np.random.normal(40, 15))  # Student acquisitions
-        
-        campaigns.append({
-            'Timestamp': timestamp.strftime('%Y-%m-%d'),
-            'Campaign_ID': f"EDU_{i+1:04d}",
-            'Channel': channel,
-            'Spend': round(spend, 2),
-            'Acquisitions': max(1, acquisitions)
-        })
-    
-    targets = [
-        {'Metric_Name': 'Student_Enrollment_Target', 'Value': 10000},
-        {'Metric_Name': 'Course_Completion_Target', 'Value': 80},
-        {'Metric_Name': 'Student_Satisfaction_Target', 'Value': 90},
-        {'Metric_Name': 'Revenue_Per_Student_Target', 'Value': 200}
-    ]
-    
-    return {
-        'Transactions': pd.DataFrame(transactions),
-        'Campaign_Data': pd.DataFrame(campaigns),
-        'Targets': pd.DataFrame(targets)
-    }
+def _write_dataset(filename, data):
+    """Save one dataset as a three-sheet workbook"""
+    # Columns go straight to xlsxwriter, skipping pandas' cell-by-cell ExcelFormatter.
+    # constant_memory is left off: it only keeps the current row, so column writes would be lost.
+    workbook = xlsxwriter.Workbook(filename)
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+    for sheet_name in ('Transactions', 'Campaign_Data', 'Targets'):
+        df = data[sheet_name]
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, df.columns, header_format)
+        for col_idx, column in enumerate(df.columns):
+            worksheet.write_column(1, col_idx, df[column].tolist())
+    workbook.close()
+    
+    print(f"Created {filename} with {len(data['Transactions'])} transactions, {len(data['Campaign_Data'])} campaigns, and {len(data['Targets'])} targets")
 
 if __name__ == "__main__":
-    # Create all datasets
-    datasets = create_perfect_datasets()
-    
-    # Save each dataset
-    for filename, data in datasets:
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            data['Transactions'].to_excel(writer, sheet_name='Transactions', index=False)
-            data['Campaign_Data'].to_excel(writer, sheet_name='Campaign_Data', index=False)
-            data['Targets'].to_excel(writer, sheet_name='Targets', index=False)
-        
-        print(f"Created {filename} with {len(data['Transactions'])} transactions, {len(data['Campaign_Data'])} campaigns, and {len(data['Targets'])} targets")
-    
-    print(f"\n✅ Created {len(datasets)} perfect datasets with 500 entries each!")
+    # Save each dataset as it is built; the files are independent so they are written concurrently
+    max_workers = min(len(DATASET_SPECS), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = set()
+        for filename, data in create_perfect_datasets():
+            # Only hold as many built datasets as there are writers
+            if len(pending) >= max_workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            pending.add(executor.submit(_write_dataset, filename, data))
+        for future in pending:
+            future.result()
+    
+    print(f"\n✅ Created {len(DATASET_SPECS)} perfect datasets with 500 entries each!")
     print("Each dataset is optimized for analytics graphs and KPI calculations.")
@@ -9,10 +9,43 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
-import json
+import orjson
+import atexit
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from config import GEMINI_API_KEY, GEMINI_API_URL
 import requests
 
+# The data summary may carry numpy scalars and non-string keys (month or weekday numbers)
+PROMPT_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# An analyzer is created per analysis, so the pooled session lives at module level
+# and repeat analyses reuse the open TLS connection to Groq
+_http = requests.Session()
+_http.headers.update({'Content-Type': 'application/json'})
+atexit.register(_http.close)
+
+# Valid JSON insight responses keyed by a digest of the prompt, so re-analysing unchanged
+# data (e.g. a dashboard refresh) skips the LLM round trip. The text is kept rather than
+# the parsed dict so every caller gets its own copy.
+INSIGHTS_CACHE_SIZE = 128
+_insights_cache: Dict[bytes, str] = {}
+_insights_cache_lock = threading.Lock()
+
+def _cached_insights(key: bytes) -> Optional[str]:
+    """Response previously returned for this prompt, or None"""
+    with _insights_cache_lock:
+        return _insights_cache.get(key)
+
+def _cache_insights(key: bytes, response: str):
+    """Remember a response that parsed as JSON"""
+    with _insights_cache_lock:
+        if key not in _insights_cache and len(_insights_cache) >= INSIGHTS_CACHE_SIZE:
+            # Dicts keep insertion order, so this drops the oldest entry
+            del _insights_cache[next(iter(_insights_cache))]
+        _insights_cache[key] = response
+
 class IntelligentFinancialAnalyzer:
     """
     An intelligent financial analyzer that:
@@ -34,17 +67,29 @@ class IntelligentFinancialAnalyzer:
         Main analysis function that provides comprehensive financial insights
         """
         try:
-            # Step 1: Calculate current financial metrics
-            current_metrics = self._calculate_current_metrics(transactions_df, campaigns_df, targets_df)
-            
-            # Step 2: Identify patterns and trends
-            patterns = self._identify_patterns(transactions_df, campaigns_df, targets_df)
-            
-            # Step 3: Generate AI-powered insights
-            ai_insights = self._generate_ai_insights(transactions_df, campaigns_df, targets_df, current_metrics, patterns)
-            
-            # Step 4: Create prediction scenarios
-            predictions = self._create_prediction_scenarios(current_metrics, patterns, ai_insights)
+            # Parse the date columns once; every helper below reads them as datetimes
+            transactions_df = self._with_parsed_dates(transactions_df, 'Date')
+            campaigns_df = self._with_parsed_dates(campaigns_df, 'Timestamp')
+            
+            # Channel is only used as a groupby key; categorical codes are cheaper to group than strings
+            if 'Channel' in campaigns_df.columns and campaigns_df['Channel'].dtype == object:
+                campaigns_df = campaigns_df.assign(Channel=campaigns_df['Channel'].astype('category'))
+            
+            # Group Amount by calendar period once for the cash flow, pattern and seasonality helpers
+            date_groups = self._group_amounts_by_date(transactions_df)
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Step 1 and 2: Calculate current financial metrics and identify patterns and trends
+                metrics_future = executor.submit(self._calculate_current_metrics, transactions_df, campaigns_df, targets_df, date_groups)
+                patterns_future = executor.submit(self._identify_patterns, transactions_df, campaigns_df, targets_df, date_groups)
+                current_metrics, patterns = metrics_future.result(), patterns_future.result()
+                
+                # Step 3: Generate AI-powered insights in the background
+                insights_future = executor.submit(self._generate_ai_insights, transactions_df, campaigns_df, targets_df, current_metrics, patterns)
+                
+                # Step 4: Create prediction scenarios while the AI request is in flight
+                predictions = self._create_prediction_scenarios(current_metrics, patterns)
+                ai_insights = insights_future.result()
             
             return {
                 "current_metrics": current_metrics,
@@ -61,22 +106,24 @@ class IntelligentFinancialAnalyzer:
     
     def _calculate_current_metrics(self, transactions_df: pd.DataFrame, 
                                  campaigns_df: pd.DataFrame, 
-                                 targets_df: pd.DataFrame) -> Dict[str, Any]:
+                                 targets_df: pd.DataFrame,
+                                 date_groups: Optional[Dict[str, pd.Series]] = None) -> Dict[str, Any]:
         """
         Calculate current financial metrics from the data
         """
         metrics = {}
         
-        # Revenue Analysis
-        if 'Amount' in transactions_df.columns:
-            positive_amounts = transactions_df[transactions_df['Amount'] > 0]['Amount']
-            negative_amounts = transactions_df[transactions_df['Amount'] < 0]['Amount']
-            
-            # Handle NaN values
-            total_revenue = float(positive_amounts.sum()) if not positive_amounts.empty else 0.0
-            total_expenses = float(abs(negative_amounts.sum())) if not negative_amounts.empty else 0.0
+        # Revenue Analysis - one float64 view of Amount shared by every metric below
+        amounts = transactions_df['Amount'].to_numpy(dtype=np.float64, na_value=np.nan) if 'Amount' in transactions_df.columns else None
+        total_revenue = None
+        if amounts is not None:
+            positive_amounts = amounts[amounts > 0]
+            
+            # NaN compares False on both sides, so it never reaches either total
+            total_revenue = float(positive_amounts.sum())
+            total_expenses = abs(float(amounts[amounts < 0].sum()))
             net_income = total_revenue - total_expenses
-            avg_transaction_value = float(positive_amounts.mean()) if not positive_amounts.empty and not positive_amounts.mean() != positive_amounts.mean() else 0.0
+            avg_transaction_value = total_revenue / positive_amounts.size if positive_amounts.size else 0.0
             transaction_count = len(transactions_df)
             revenue_growth_rate = self._calculate_growth_rate(positive_amounts)
             
@@ -91,12 +138,13 @@ class IntelligentFinancialAnalyzer:
         
         # Cash Flow Analysis
         if 'Date' in transactions_df.columns and 'Amount' in transactions_df.columns:
-            metrics['cash_flow'] = self._analyze_cash_flow(transactions_df)
+            metrics['cash_flow'] = self._analyze_cash_flow(date_groups)
         
         # Marketing Analysis
+        total_spend = total_acquisitions = None
         if 'Spend' in campaigns_df.columns and 'Acquisitions' in campaigns_df.columns:
-            total_spend = float(campaigns_df['Spend'].sum()) if not campaigns_df['Spend'].empty else 0.0
-            total_acquisitions = float(campaigns_df['Acquisitions'].sum()) if not campaigns_df['Acquisitions'].empty else 0.0
+            total_spend = float(campaigns_df['Spend'].sum())
+            total_acquisitions = float(campaigns_df['Acquisitions'].sum())
             
             # Calculate CAC safely
             if total_acquisitions > 0:
@@ -105,7 +153,7 @@ class IntelligentFinancialAnalyzer:
                 cost_per_acquisition = 0.0
             
             acquisition_growth_rate = self._calculate_growth_rate(campaigns_df['Acquisitions'])
-            spend_efficiency = self._calculate_spend_efficiency(campaigns_df, transactions_df)
+            spend_efficiency = self._calculate_spend_efficiency(total_spend, total_revenue)
             
             metrics['marketing'] = {
                 'total_spend': total_spend,
@@ -116,20 +164,20 @@ class IntelligentFinancialAnalyzer:
             }
         
         # Performance Metrics
-        metrics['performance'] = self._calculate_performance_metrics(transactions_df, campaigns_df, targets_df)
+        metrics['performance'] = self._calculate_performance_metrics(amounts, total_spend, total_acquisitions)
         
         return metrics
     
-    def _analyze_cash_flow(self, transactions_df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_cash_flow(self, date_groups: Optional[Dict[str, pd.Series]]) -> Dict[str, Any]:
         """
         Analyze cash flow patterns
         """
         try:
-            # Convert date column to datetime
-            transactions_df['Date'] = pd.to_datetime(transactions_df['Date'])
+            if date_groups is None:
+                raise ValueError("transactions could not be grouped by date")
             
-            # Group by month for trend analysis
-            monthly_cashflow = transactions_df.groupby(transactions_df['Date'].dt.to_period('M'))['Amount'].sum()
+            # Monthly totals for trend analysis
+            monthly_cashflow = date_groups['period_sum']
             
             # Calculate cash flow metrics with NaN handling
             monthly_mean = monthly_cashflow.mean()
@@ -154,7 +202,8 @@ class IntelligentFinancialAnalyzer:
     
     def _identify_patterns(self, transactions_df: pd.DataFrame, 
                           campaigns_df: pd.DataFrame, 
-                          targets_df: pd.DataFrame) -> Dict[str, Any]:
+                          targets_df: pd.DataFrame,
+                          date_groups: Optional[Dict[str, pd.Series]] = None) -> Dict[str, Any]:
         """
         Identify patterns and trends in the data
         """
@@ -162,29 +211,31 @@ class IntelligentFinancialAnalyzer:
         
         # Transaction patterns
         if 'Date' in transactions_df.columns and 'Amount' in transactions_df.columns:
-            patterns['transaction_patterns'] = self._analyze_transaction_patterns(transactions_df)
+            patterns['transaction_patterns'] = self._analyze_transaction_patterns(transactions_df, date_groups)
         
         # Campaign patterns
         if 'Timestamp' in campaigns_df.columns and 'Spend' in campaigns_df.columns:
             patterns['campaign_patterns'] = self._analyze_campaign_patterns(campaigns_df)
         
         # Seasonal patterns
-        patterns['seasonality'] = self._detect_seasonality(transactions_df, campaigns_df)
+        patterns['seasonality'] = self._detect_seasonality(transactions_df, date_groups)
         
         return patterns
     
-    def _analyze_transaction_patterns(self, transactions_df: pd.DataFrame) -> Dict[str, Any]:
+    def _analyze_transaction_patterns(self, transactions_df: pd.DataFrame, 
+                                      date_groups: Optional[Dict[str, pd.Series]]) -> Dict[str, Any]:
         """
         Analyze transaction patterns
         """
         try:
-            transactions_df['Date'] = pd.to_datetime(transactions_df['Date'])
+            if date_groups is None:
+                raise ValueError("transactions could not be grouped by date")
             
             # Daily patterns
-            daily_amounts = transactions_df.groupby(transactions_df['Date'].dt.dayofweek)['Amount'].mean()
+            daily_amounts = date_groups['weekday_mean']
             
             # Monthly patterns
-            monthly_amounts = transactions_df.groupby(transactions_df['Date'].dt.month)['Amount'].mean()
+            monthly_amounts = date_groups['month_mean']
             
             # Calculate transaction frequency safely
             date_range = (transactions_df['Date'].max() - transactions_df['Date'].min()).days + 1
@@ -211,21 +262,18 @@ class IntelligentFinancialAnalyzer:
         Analyze campaign performance patterns
         """
         try:
-            campaigns_df['Timestamp'] = pd.to_datetime(campaigns_df['Timestamp'])
-            
             # Channel performance
+            best_channel = worst_channel = "Unknown"
             if 'Channel' in campaigns_df.columns:
-                channel_performance = campaigns_df.groupby('Channel').agg({
-                    'Spend': 'sum',
-                    'Acquisitions': 'sum'
-                })
-                # Calculate CPA safely
-                channel_performance['CPA'] = channel_performance['Spend'] / channel_performance['Acquisitions'].replace(0, 1)
-                
-                best_channel = channel_performance['CPA'].idxmin() if not channel_performance.empty else "Unknown"
-                worst_channel = channel_performance['CPA'].idxmax() if not channel_performance.empty else "Unknown"
-            else:
-                best_channel = worst_channel = "Unknown"
+                channel_totals = campaigns_df.groupby('Channel', observed=True)[['Spend', 'Acquisitions']].sum()
+                if not channel_totals.empty:
+                    spend = channel_totals['Spend'].to_numpy(dtype=np.float64)
+                    acquisitions = channel_totals['Acquisitions'].to_numpy(dtype=np.float64)
+                    
+                    # Calculate CPA safely - channels without acquisitions are charged their whole spend
+                    cpa = spend / np.where(acquisitions == 0, 1, acquisitions)
+                    best_channel = channel_totals.index[np.nanargmin(cpa)]
+                    worst_channel = channel_totals.index[np.nanargmax(cpa)]
             
             # Calculate campaign frequency safely
             date_range = (campaigns_df['Timestamp'].max() - campaigns_df['Timestamp'].min()).days + 1
@@ -242,7 +290,8 @@ class IntelligentFinancialAnalyzer:
             print(f"Error analyzing campaign patterns: {e}")
             return {}
     
-    def _detect_seasonality(self, transactions_df: pd.DataFrame, campaigns_df: pd.DataFrame) -> Dict[str, Any]:
+    def _detect_seasonality(self, transactions_df: pd.DataFrame, 
+                            date_groups: Optional[Dict[str, pd.Series]]) -> Dict[str, Any]:
         """
         Detect seasonal patterns in the data
         """
@@ -250,8 +299,9 @@ class IntelligentFinancialAnalyzer:
         
         try:
             if 'Date' in transactions_df.columns:
-                transactions_df['Date'] = pd.to_datetime(transactions_df['Date'])
-                monthly_revenue = transactions_df.groupby(transactions_df['Date'].dt.month)['Amount'].sum()
+                if date_groups is None:
+                    raise ValueError("transactions could not be grouped by date")
+                monthly_revenue = date_groups['month_sum']
                 
                 if not monthly_revenue.empty:
                     # Calculate seasonality index safely
@@ -282,13 +332,10 @@ class IntelligentFinancialAnalyzer:
         return seasonality
     
     def _create_prediction_scenarios(self, current_metrics: Dict, 
-                                   patterns: Dict, 
-                                   ai_insights: Dict) -> Dict[str, Any]:
+                                   patterns: Dict) -> Dict[str, Any]:
         """
         Create prediction scenarios for different timeframes
         """
-        predictions = {}
-        
         # Define timeframes
         timeframes = {
             '30_days': 30,
@@ -297,22 +344,10 @@ class IntelligentFinancialAnalyzer:
             '6_months': 180,
             '1_year': 365
         }
+        months = np.array(list(timeframes.values())) / 30
         
-        for timeframe_name, days in timeframes.items():
-            predictions[timeframe_name] = self._predict_for_timeframe(
-                current_metrics, patterns, ai_insights, days
-            )
-        
-        return predictions
-    
-    def _predict_for_timeframe(self, current_metrics: Dict, 
-                             patterns: Dict, 
-                             ai_insights: Dict, 
-                             days: int) -> Dict[str, Any]:
-        """
-        Predict financial metrics for a specific timeframe
-        """
-        prediction = {}
+        # Each projection holds one value per timeframe
+        projections = {}
         
         # Revenue prediction
         if 'revenue' in current_metrics:
@@ -320,9 +355,13 @@ class IntelligentFinancialAnalyzer:
             current_revenue = current_metrics['revenue']['total_revenue']
             
             # Project revenue based on growth rate
-            projected_revenue = current_revenue * (1 + revenue_growth) ** (days / 30)
-            prediction['projected_revenue'] = float(projected_revenue)
-            prediction['revenue_growth'] = float((projected_revenue - current_revenue) / current_revenue * 100)
+            projected_revenue = current_revenue * (1 + revenue_growth) ** months
+            projections['projected_revenue'] = projected_revenue
+            # No revenue to grow from: report flat growth instead of failing the whole analysis
+            if current_revenue == 0:
+                projections['revenue_growth'] = np.zeros(months.size)
+            else:
+                projections['revenue_growth'] = (projected_revenue - current_revenue) / current_revenue * 100
         
         # Cash flow prediction
         if 'cash_flow' in current_metrics:
@@ -330,9 +369,8 @@ class IntelligentFinancialAnalyzer:
             trend = current_metrics['cash_flow'].get('cash_flow_trend', 0)
             
             # Project cash flow considering trend
-            projected_cashflow = monthly_avg * (days / 30) * (1 + trend)
-            prediction['projected_cash_flow'] = float(projected_cashflow)
-            prediction['cash_flow_trend'] = float(trend * 100)
+            projections['projected_cash_flow'] = monthly_avg * months * (1 + trend)
+            projections['cash_flow_trend'] = np.full(months.size, trend * 100)
         
         # Marketing prediction
         if 'marketing' in current_metrics:
@@ -340,21 +378,26 @@ class IntelligentFinancialAnalyzer:
             acquisition_growth = current_metrics['marketing'].get('acquisition_growth_rate', 0)
             
             # Project acquisitions and spend
-            projected_acquisitions = current_metrics['marketing']['total_acquisitions'] * (1 + acquisition_growth) ** (days / 30)
-            projected_spend = projected_acquisitions * current_cpa
+            projected_acquisitions = current_metrics['marketing']['total_acquisitions'] * (1 + acquisition_growth) ** months
             
-            prediction['projected_acquisitions'] = float(projected_acquisitions)
-            prediction['projected_marketing_spend'] = float(projected_spend)
-            prediction['projected_cpa'] = float(current_cpa)
+            projections['projected_acquisitions'] = projected_acquisitions
+            projections['projected_marketing_spend'] = projected_acquisitions * current_cpa
+            projections['projected_cpa'] = np.full(months.size, current_cpa)
+        
+        # Risk assessment doesn't depend on the timeframe
+        risk_level = self._assess_risk(current_metrics, patterns)
         
-        # Risk assessment
-        prediction['risk_level'] = self._assess_risk(current_metrics, patterns, days)
+        predictions = {}
+        for i, timeframe_name in enumerate(timeframes):
+            prediction = {name: float(values[i]) for name, values in projections.items()}
+            prediction['risk_level'] = risk_level
+            predictions[timeframe_name] = prediction
         
-        return prediction
+        return predictions
     
-    def _assess_risk(self, current_metrics: Dict, patterns: Dict, days: int) -> str:
+    def _assess_risk(self, current_metrics: Dict, patterns: Dict) -> str:
         """
-        Assess financial risk for the prediction timeframe
+        Assess financial risk for the prediction timeframes
         """
         risk_factors = []
         
@@ -408,7 +451,7 @@ class IntelligentFinancialAnalyzer:
             You are a senior financial analyst. Analyze this financial data and provide BRIEF strategic insights.
             
             DATA SUMMARY:
-            {json.dumps(data_summary, indent=2)}
+            {orjson.dumps(data_summary, default=str, option=PROMPT_JSON_OPTIONS).decode()}
             
             Provide CONCISE insights (2-3 lines maximum per section):
             1. Key financial strengths and weaknesses
@@ -430,12 +473,16 @@ class IntelligentFinancialAnalyzer:
             IMPORTANT: Keep each insight to maximum 2-3 lines. Be direct and actionable.
             """
             
-            response = self._call_gemini_api(prompt)
+            cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+            response = _cached_insights(cache_key)
+            if response is None:
+                response = self._call_gemini_api(prompt)
             
             try:
-                insights = json.loads(response)
+                insights = orjson.loads(response)
+                _cache_insights(cache_key, response)
                 return insights
-            except:
+            except orjson.JSONDecodeError:
                 return self._create_fallback_insights(current_metrics, patterns)
                 
         except Exception as e:
@@ -452,7 +499,6 @@ class IntelligentFinancialAnalyzer:
                 return "AI analysis unavailable - no API key"
             
             headers = {
-                'Content-Type': 'application/json',
                 'Authorization': f'Bearer {self.api_key}'
             }
             
@@ -463,11 +509,13 @@ class IntelligentFinancialAnalyzer:
                     {"role": "user", "content": prompt}
                 ],
                 "temperature": 0.7,
-                "max_tokens": 800
+                "max_tokens": 800,
+                # JSON mode: the reply is a bare JSON object, never wrapped in prose or code fences
+                "response_format": {"type": "json_object"}
             }
             
             print("🤖 Calling Groq API for intelligent financial analysis...")
-            response = requests.post(
+            response = _http.post(
                 self.api_url,
                 headers=headers,
                 json=data,
@@ -475,7 +523,7 @@ class IntelligentFinancialAnalyzer:
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 if 'choices' in result and len(result['choices']) > 0:
                     print("✅ Groq API analysis completed")
                     return result['choices'][0]['message']['content']
@@ -488,22 +536,52 @@ class IntelligentFinancialAnalyzer:
             return "AI analysis unavailable - connection error"
     
     # Helper methods
-    def _calculate_growth_rate(self, series: pd.Series) -> float:
-        """Calculate growth rate from a time series"""
+    def _group_amounts_by_date(self, transactions_df: pd.DataFrame) -> Optional[Dict[str, pd.Series]]:
+        """Group Amount by month period, calendar month and weekday; None if the frame can't be grouped"""
+        if 'Date' not in transactions_df.columns or 'Amount' not in transactions_df.columns:
+            return None
+        
         try:
-            if len(series) < 2:
-                return 0.0
+            amounts = transactions_df['Amount']
+            dates = transactions_df['Date'].dt
             
+            # Sum and mean per calendar month share one factorization of the key
+            by_month = amounts.groupby(dates.month).agg(['sum', 'mean'])
+            return {
+                'period_sum': amounts.groupby(dates.to_period('M')).sum(),
+                'month_sum': by_month['sum'],
+                'month_mean': by_month['mean'],
+                'weekday_mean': amounts.groupby(dates.dayofweek).mean()
+            }
+        except Exception as e:
+            print(f"Error grouping transactions by date: {e}")
+            return None
+    
+    def _with_parsed_dates(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        """Return df with column converted to datetime64, without touching the caller's frame"""
+        if column not in df.columns or pd.api.types.is_datetime64_any_dtype(df[column]):
+            return df
+        try:
+            return df.assign(**{column: pd.to_datetime(df[column])})
+        except (ValueError, TypeError) as e:
+            # Leave the column as-is so only the date-based helpers fall back, as before
+            print(f"Could not parse {column} column as dates: {e}")
+            return df
+    
+    def _calculate_growth_rate(self, values) -> float:
+        """Calculate growth rate from a time series (Series or float array)"""
+        try:
             # Handle NaN values
-            series_clean = series.dropna()
-            if len(series_clean) < 2:
+            values_clean = np.asarray(values, dtype=np.float64)
+            values_clean = values_clean[~np.isnan(values_clean)]
+            if len(values_clean) < 2:
                 return 0.0
             
             # Simple linear growth rate
-            first_half = series_clean.iloc[:len(series_clean)//2].mean()
-            second_half = series_clean.iloc[len(series_clean)//2:].mean()
+            first_half = values_clean[:len(values_clean)//2].mean()
+            second_half = values_clean[len(values_clean)//2:].mean()
             
-            if first_half == 0 or pd.isna(first_half) or pd.isna(second_half):
+            if first_half == 0:
                 return 0.0
             
             growth_rate = (second_half - first_half) / first_half
@@ -522,46 +600,36 @@ class IntelligentFinancialAnalyzer:
             if len(values_clean) < 2:
                 return 0.0
             
-            # Simple linear trend
-            x = np.arange(len(values_clean))
-            slope = np.polyfit(x, values_clean, 1)[0]
+            # Least-squares slope against 0..n-1 in closed form; sum of (i - centre)^2 is n(n^2 - 1)/12
+            n = len(values_clean)
+            centred = np.arange(n) - (n - 1) / 2
+            slope = 12 * np.dot(centred, values_clean) / (n * (n * n - 1))
             mean_value = np.mean(values_clean)
             return float(slope / mean_value) if mean_value != 0 and not np.isnan(slope) and slope != float('inf') else 0.0
         except:
             return 0.0
     
-    def _calculate_spend_efficiency(self, campaigns_df: pd.DataFrame, transactions_df: pd.DataFrame) -> float:
+    def _calculate_spend_efficiency(self, total_spend: Optional[float], total_revenue: Optional[float]) -> float:
         """Calculate marketing spend efficiency"""
-        try:
-            total_spend = float(campaigns_df['Spend'].sum()) if not campaigns_df['Spend'].empty else 0.0
-            positive_amounts = transactions_df[transactions_df['Amount'] > 0]['Amount']
-            total_revenue = float(positive_amounts.sum()) if not positive_amounts.empty else 0.0
-            
-            if total_spend == 0:
-                return 0.0
-            
-            efficiency = total_revenue / total_spend
-            return float(efficiency) if not pd.isna(efficiency) and efficiency != float('inf') else 0.0
-        except:
+        if not total_spend or total_revenue is None:
             return 0.0
+        
+        efficiency = total_revenue / total_spend
+        return float(efficiency) if not pd.isna(efficiency) and efficiency != float('inf') else 0.0
     
-    def _calculate_performance_metrics(self, transactions_df: pd.DataFrame, 
-                                    campaigns_df: pd.DataFrame, 
-                                    targets_df: pd.DataFrame) -> Dict[str, Any]:
-        """Calculate overall performance metrics"""
+    def _calculate_performance_metrics(self, amounts: Optional[np.ndarray], 
+                                    total_spend: Optional[float], 
+                                    total_acquisitions: Optional[float]) -> Dict[str, Any]:
+        """Calculate overall performance metrics from the totals already computed"""
         metrics = {}
         
-        # Transaction success rate
-        if 'Amount' in transactions_df.columns:
-            successful_transactions = len(transactions_df[transactions_df['Amount'] != 0])
-            total_transactions = len(transactions_df)
-            success_rate = float(successful_transactions / total_transactions) if total_transactions > 0 else 0.0
-            metrics['transaction_success_rate'] = success_rate if not pd.isna(success_rate) else 0.0
+        # Transaction success rate (NaN amounts count as non-zero, as before)
+        if amounts is not None:
+            success_rate = float(np.count_nonzero(amounts != 0) / amounts.size) if amounts.size else 0.0
+            metrics['transaction_success_rate'] = success_rate
         
         # Customer acquisition efficiency
-        if 'Spend' in campaigns_df.columns and 'Acquisitions' in campaigns_df.columns:
-            total_spend = float(campaigns_df['Spend'].sum()) if not campaigns_df['Spend'].empty else 0.0
-            total_acquisitions = float(campaigns_df['Acquisitions'].sum()) if not campaigns_df['Acquisitions'].empty else 0.0
+        if total_spend is not None:
             efficiency = float(total_acquisitions / total_spend) if total_spend > 0 else 0.0
             metrics['acquisition_efficiency'] = efficiency if not pd.isna(efficiency) else 0.0
         
@@ -570,16 +638,16 @@ class IntelligentFinancialAnalyzer:
     def _get_date_range(self, transactions_df: pd.DataFrame, campaigns_df: pd.DataFrame) -> str:
         """Get date range of the data"""
         try:
-            dates = []
-            if 'Date' in transactions_df.columns:
-                dates.extend(transactions_df['Date'].tolist())
-            if 'Timestamp' in campaigns_df.columns:
-                dates.extend(campaigns_df['Timestamp'].tolist())
-            
-            if dates:
-                min_date = min(dates)
-                max_date = max(dates)
-                return f"{min_date} to {max_date}"
+            # Per-column min/max run on the datetime64 buffers; only the endpoints become Python objects
+            bounds = []
+            for df, column in ((transactions_df, 'Date'), (campaigns_df, 'Timestamp')):
+                if column in df.columns:
+                    bounds.extend((df[column].min(), df[column].max()))
+            
+            # An empty column has no min/max (NaT)
+            bounds = [date for date in bounds if not pd.isna(date)]
+            if bounds:
+                return f"{min(bounds)} to {max(bounds)}"
             return "Unknown"
         except:
             return "Unknown"
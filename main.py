@@ -1,6 +1,7 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from typing import Optional
 import tempfile
@@ -66,7 +67,8 @@ async def root():
 async def register(request: RegisterRequest):
     """Register a new user"""
     try:
-        result = register_user(request.email, request.password, request.name)
+        # scrypt and MongoDB calls block, so keep them off the event loop
+        result = await run_in_threadpool(register_user, request.email, request.password, request.name)
         if result["success"]:
             return JSONResponse(content=result, status_code=201)
         else:
@@ -78,7 +80,7 @@ async def register(request: RegisterRequest):
 async def login(request: LoginRequest):
     """Login user and return session token"""
     try:
-        result = login_user(request.email, request.password)
+        result = await run_in_threadpool(login_user, request.email, request.password)
         if result["success"]:
             return JSONResponse(content=result)
         else:
@@ -90,7 +92,7 @@ async def login(request: LoginRequest):
 async def logout(request: LogoutRequest):
     """Logout user and invalidate session"""
     try:
-        result = logout_user(request.session_token)
+        result = await run_in_threadpool(logout_user, request.session_token)
         return JSONResponse(content=result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Logout error: {str(e)}")
@@ -103,7 +105,7 @@ async def get_user(authorization: Optional[str] = Header(None)):
             raise HTTPException(status_code=401, detail="No valid authorization token")
         
         session_token = authorization.replace("Bearer ", "")
-        user_info = get_user_info(session_token)
+        user_info = await run_in_threadpool(get_user_info, session_token)
         
         if not user_info:
             raise HTTPException(status_code=401, detail="Invalid or expired session")
@@ -291,31 +293,6 @@ async def ai_excel_conversation(request: AIExcelConversationRequest):
         
         filepath = uploaded_files[request.file_id]
         
-        # Get the processed financial data for context
-        latest_financial_data = None
-        if processed_financial_data:
-            try:
-                latest_file_id = max(processed_financial_data.keys(), key=lambda k: int(k.split('_')[1]) if '_' in k else 0)
-                latest_financial_data = processed_financial_data[latest_file_id]
-                print(f"📊 Using processed financial data for Excel conversation")
-            except Exception as e:
-                print(f"Error getting processed financial data: {e}")
-        
-        # Create context for Gemini API
-        context = {
-            'processed_financial_data': latest_financial_data,
-            'user_request': request.user_response,
-            'conversation_step': request.conversation_step,
-            'file_path': filepath
-        }
-        
-        # Use Gemini API for Excel analysis
-        gemini_response = get_gemini_response(
-            f"Excel Processing Request: {request.user_response}. Analyze the Excel file and provide specific recommendations for modifications.",
-            context,
-            "Excel Assistant"
-        )
-        
         # Process user response with AI
         result = process_excel_with_ai_interaction(
             filepath, 
@@ -323,11 +300,37 @@ async def ai_excel_conversation(request: AIExcelConversationRequest):
             request.conversation_step
         )
         
-        # Enhance result with Gemini analysis
         if result.get('status') == 'continue_conversation':
-            result['ai_question'] = gemini_response
+            # Only ask Gemini for the next question when the conversation actually continues
+            latest_financial_data = None
+            if processed_financial_data:
+                try:
+                    latest_file_id = max(processed_financial_data.keys(), key=lambda k: int(k.split('_')[1]) if '_' in k else 0)
+                    latest_financial_data = processed_financial_data[latest_file_id]
+                    print(f"📊 Using processed financial data for Excel conversation")
+                except Exception as e:
+                    print(f"Error getting processed financial data: {e}")
+            
+            # Create context for Gemini API
+            context = {
+                'processed_financial_data': latest_financial_data,
+                'user_request': request.user_response,
+                'conversation_step': request.conversation_step,
+                'file_path': filepath
+            }
+            
+            result['ai_question'] = get_gemini_response(
+                f"Excel Processing Request: {request.user_response}. Analyze the Excel file and provide specific recommendations for modifications.",
+                context,
+                "Excel Assistant"
+            )
         elif result.get('status') == 'success':
-            result['gemini_analysis'] = gemini_response
+            # Requirements were understood in one turn; summarise without another AI roundtrip
+            modifications_applied = result.get('modifications_applied', [])
+            if modifications_applied:
+                result['gemini_analysis'] = f"Applied: {'; '.join(modifications_applied)}"
+            else:
+                result['gemini_analysis'] = "No modifications were required."
         
         if result['status'] == 'success' and 'output_file' in result:
             # Store the output file path
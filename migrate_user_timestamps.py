@@ -0,0 +1,48 @@
+"""
+One-off migration for user timestamps
+Converts created_at/last_login values left as ISO strings (or missing) by the old JSON
+store into dates, so get_user_info can format them without checking their type.
+Run once against each database before deploying: python migrate_user_timestamps.py
+"""
+
+import sys
+from dotenv import load_dotenv
+
+# auth_service reads MONGODB_URI and SESSION_SECRET at import time
+load_dotenv()
+
+from auth_service import users_collection
+
+
+def _as_date(value, fallback):
+    """Pipeline expression converting value to a date, or fallback if it is null or unparseable"""
+    return {"$convert": {"input": value, "to": "date", "onError": fallback, "onNull": fallback}}
+
+
+# Field -> value for documents where it isn't a date. A created_at that can't be parsed
+# falls back to the insertion time recorded in the ObjectId; last_login to "never"
+MIGRATIONS = {
+    "created_at": _as_date("$created_at", _as_date("$_id", None)),
+    "last_login": _as_date("$last_login", None),
+}
+
+
+def migrate_user_timestamps(users) -> int:
+    """Rewrite non-date timestamps server-side, one update per field; returns the users left unfixed"""
+    for field, as_date in MIGRATIONS.items():
+        result = users.update_many({field: {"$not": {"$type": "date"}}}, [{"$set": {field: as_date}}])
+        print(f"✓ {field}: converted {result.modified_count} users")
+    
+    # last_login may legitimately be null; created_at must end up a date for every user
+    remaining = users.count_documents({"created_at": {"$not": {"$type": "date"}}})
+    if remaining:
+        print(f"⚠ {remaining} users still have no created_at date; set it by hand before deploying")
+    return remaining
+
+
+if __name__ == "__main__":
+    users = users_collection()
+    if users is None:
+        print("✗ Cannot migrate: No database connection")
+        sys.exit(1)
+    sys.exit(1 if migrate_user_timestamps(users) else 0)
@@ -4,11 +4,14 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, Any, Tuple
 import requests
-import json
+import orjson
 import math
 from config import GEMINI_API_KEY, GEMINI_API_URL
 from bulletproof_excel_processor import load_data_from_excel_bulletproof as intelligent_load_excel
 
+# Prompt context may carry numpy scalars and non-string keys (e.g. month numbers), as json.dumps allowed
+PROMPT_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
 def safe_float(value: float) -> float:
     """
     Convert value to safe float for JSON serialization
@@ -524,9 +527,9 @@ def run_sentinel_check(campaign_df: pd.DataFrame, targets_df: pd.DataFrame, tran
             
             # Try to parse as direct JSON first
             try:
-                parsed_response = json.loads(clean_response)
+                parsed_response = orjson.loads(clean_response)
                 return parsed_response
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
             
             # Remove any markdown formatting if present
@@ -538,7 +541,7 @@ def run_sentinel_check(campaign_df: pd.DataFrame, targets_df: pd.DataFrame, tran
             json_match = re.search(r'\{.*\}', clean_response, re.DOTALL)
             if json_match:
                 json_str = json_match.group(0)
-                parsed_response = json.loads(json_str)
+                parsed_response = orjson.loads(json_str)
                 return parsed_response
             else:
                 raise json.JSONDecodeError("No JSON found", clean_response, 0)
@@ -602,7 +605,7 @@ def analyze_data_with_gemini(transactions_df: pd.DataFrame, campaign_df: pd.Data
         You are a financial data analyst. Analyze this Excel data and determine which KPIs are relevant and which should be marked as null/irrelevant.
 
         DATA SUMMARY:
-        {json.dumps(data_summary, indent=2)}
+        {orjson.dumps(data_summary, option=PROMPT_JSON_OPTIONS, default=str).decode()}
 
         For each KPI, determine if it's relevant based on the available data:
         1. Cash Visibility - relevant if there are transaction amounts
@@ -627,9 +630,9 @@ def analyze_data_with_gemini(transactions_df: pd.DataFrame, campaign_df: pd.Data
         
         # Try to parse JSON response
         try:
-            analysis = json.loads(response)
+            analysis = orjson.loads(response)
             print(f"✅ Gemini analysis successful: {len(analysis.get('relevant_kpis', []))} relevant KPIs")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"⚠️ Failed to parse Gemini JSON response: {e}")
             print(f"Raw response: {response[:200]}...")
             # More intelligent fallback based on actual data
@@ -856,7 +859,7 @@ def get_gemini_response(query: str, context, persona: str = "CFO") -> str:
         
         # Handle context - convert to string if it's an object
         if isinstance(context, dict):
-            context_str = json.dumps(context, indent=2)
+            context_str = orjson.dumps(context, option=PROMPT_JSON_OPTIONS, default=str).decode()
         else:
             context_str = str(context)
         
@@ -914,7 +917,7 @@ IMPORTANT: If you see actual financial data above (revenue, CAC, ROI, etc.), use
             return generate_enhanced_fallback_response(query, persona, context)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             if 'choices' in result and len(result['choices']) > 0:
                 gemini_response = result['choices'][0]['message']['content']
                 print(f"✅ Groq API response received for {persona}")
@@ -932,11 +935,9 @@ def extract_financial_context(context: str) -> str:
     Extract key financial metrics from context for better AI analysis
     """
     try:
-        import json
-        
         # Handle both string and dict context
         if isinstance(context, str):
-            data = json.loads(context)
+            data = orjson.loads(context)
         else:
             data = context
         
@@ -1060,11 +1061,9 @@ def generate_enhanced_fallback_response(query: str, persona: str, context: str)
     Generate enhanced fallback responses with financial data analysis
     """
     try:
-        import json
-        
         # Handle both string and dict context
         if isinstance(context, str):
-            data = json.loads(context)
+            data = orjson.loads(context)
         else:
             data = context
         